@@ -15,9 +15,9 @@ SUPABASE_KEY = os.getenv('SUPABASE_SERVICE_KEY')
 print("🔧 Fixing Supabase get_memory_stats() function...")
 
 try:
-    from supabase import create_client
+    from supabase_helper import get_supabase
 
-    supabase = create_client(SUPABASE_URL, SUPABASE_KEY)
+    supabase = get_supabase()
 
     # Read the fixed SQL
     with open('execution/fix_stats_function.sql', 'r') as f:
@@ -0,0 +1,96 @@
+"""
+Google OAuth helper for the lead-upload scripts.
+Loads the google-drive-mcp token once per process and shares it between
+scripts, re-reading it only when the token file changes on disk.
+"""
+
+import json
+import threading
+from pathlib import Path
+from google.auth.transport.requests import Request
+from google.oauth2.credentials import Credentials
+from google_auth_oauthlib.flow import InstalledAppFlow
+
+SCOPES = ['https://www.googleapis.com/auth/spreadsheets', 'https://www.googleapis.com/auth/drive.file']
+
+# Token written by the google-drive-mcp server (and by the OAuth flow below)
+TOKEN_PATH = Path.home() / '.config/google-drive-mcp/tokens.json'
+
+# OAuth client used when there is no usable token
+OAUTH_CLIENT_PATH = Path('/Volumes/MortAihq/MortaiHQ/Agentic Agents /anti grav workflows/Lead scraper : cold email sender /gcp-oauth.keys.json')
+
+# Parsed token file, reused until the file changes on disk
+_cred_cache = {'mtime': None, 'creds': None}
+_cred_lock = threading.Lock()
+
+
+def _save_token(creds):
+    """Write credentials to the token file and remember its new mtime."""
+    TOKEN_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(TOKEN_PATH, 'w') as token:
+        token.write(creds.to_json())
+    _cred_cache['mtime'] = TOKEN_PATH.stat().st_mtime
+    _cred_cache['creds'] = creds
+
+
+def get_credentials(interactive=True):
+    """
+    Get Google credentials, refreshing or running the OAuth flow if needed.
+
+    Safe to call from several threads; the token file is parsed at most once
+    per change.
+
+    Args:
+        interactive (bool): Run the browser OAuth flow when there is no usable
+            token. With False, only an existing (refreshable) token is used.
+
+    Returns:
+        Credentials object, or None if no token or OAuth client is available
+    """
+    with _cred_lock:
+        creds = None
+
+        # Try to load existing token (skipped if the file is unchanged and still valid)
+        if TOKEN_PATH.exists():
+            mtime = TOKEN_PATH.stat().st_mtime
+            cached = _cred_cache['creds']
+            if mtime == _cred_cache['mtime'] and cached and cached.valid:
+                return cached
+
+            try:
+                with open(TOKEN_PATH, 'r') as token:
+                    token_data = json.load(token)
+                    creds = Credentials.from_authorized_user_info(token_data, SCOPES)
+                _cred_cache['mtime'] = mtime
+                _cred_cache['creds'] = creds
+            except Exception as e:
+                print(f"Could not load existing token: {e}")
+
+        # If no valid credentials, authenticate
+        if not creds or not creds.valid:
+            if creds and creds.expired and creds.refresh_token:
+                print("Refreshing expired credentials...")
+                previous_token = creds.token
+                creds.refresh(Request())
+
+                # Only rewrite the token file when the access token changed
+                if creds.token != previous_token:
+                    _save_token(creds)
+            elif not interactive:
+                print("Error: No credentials found")
+                return None
+            else:
+                print("Starting OAuth flow...")
+
+                if not OAUTH_CLIENT_PATH.exists():
+                    print(f"Error: OAuth credentials not found at {OAUTH_CLIENT_PATH}")
+                    return None
+
+                flow = InstalledAppFlow.from_client_secrets_file(str(OAUTH_CLIENT_PATH), SCOPES)
+                creds = flow.run_local_server(port=0)
+
+                # Save credentials
+                _save_token(creds)
+                print(f"Credentials saved to {TOKEN_PATH}")
+
+        return creds
@@ -3,14 +3,20 @@ Google Sheets helper functions.
 Handles authentication and common operations with Google Sheets.
 """
 
+import csv
+import io
 import os
 import pickle
+import random
+import time
+from functools import lru_cache
 from pathlib import Path
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import MediaInMemoryUpload
 
 # If modifying these scopes, delete the file token.json
 SCOPES = [
@@ -18,6 +24,44 @@ SCOPES = [
     'https://www.googleapis.com/auth/drive.file'
 ]
 
+# Above this many rows, new sheets are uploaded as one CSV file through Drive
+# instead of being sent as JSON cell values
+CSV_UPLOAD_THRESHOLD = 500
+
+# Retries for each API call, with exponential backoff (up to ~60s before the
+# last attempt), so quota pressure slows us down instead of aborting the upload
+API_RETRIES = 6
+MAX_RETRY_WAIT = 60
+
+
+def execute_with_retry(request, idempotent=False):
+    """
+    Execute an API request, retrying under quota pressure.
+
+    Idempotent requests (reads, values.batchUpdate, batchUpdate) use the
+    client's built-in retry, which also covers 5xx and connection errors.
+    Anything else (create, append) is only retried on HTTP 429: after a 5xx
+    or a dropped connection the write may already have been applied, and
+    repeating it would create a second spreadsheet or append rows twice.
+
+    Args:
+        request: googleapiclient HttpRequest
+        idempotent (bool): True if repeating the request is harmless
+
+    Returns:
+        dict: API response
+    """
+    if idempotent:
+        return request.execute(num_retries=API_RETRIES)
+
+    for attempt in range(API_RETRIES + 1):
+        try:
+            return request.execute()
+        except HttpError as error:
+            if error.resp.status != 429 or attempt == API_RETRIES:
+                raise
+            time.sleep(min(2 ** attempt + random.random(), MAX_RETRY_WAIT))
+
 
 def authenticate_google():
     """
@@ -62,18 +106,33 @@ def authenticate_google():
     return creds
 
 
+@lru_cache(maxsize=1)
 def get_sheets_service():
     """
     Get authenticated Google Sheets service.
 
+    Built once per process; every helper call reuses the same service.
+
     Returns:
         Google Sheets service object
     """
     creds = authenticate_google()
-    service = build('sheets', 'v4', credentials=creds)
+    service = build('sheets', 'v4', credentials=creds, cache_discovery=True)
     return service
 
 
+@lru_cache(maxsize=1)
+def get_drive_service():
+    """
+    Get authenticated Google Drive service.
+
+    Returns:
+        Google Drive service object
+    """
+    creds = authenticate_google()
+    return build('drive', 'v3', credentials=creds, cache_discovery=True)
+
+
 def create_spreadsheet(title):
     """
     Create a new Google Spreadsheet.
@@ -92,10 +151,10 @@ def create_spreadsheet(title):
             }
         }
 
-        spreadsheet = service.spreadsheets().create(
+        spreadsheet = execute_with_retry(service.spreadsheets().create(
             body=spreadsheet,
             fields='spreadsheetId,spreadsheetUrl'
-        ).execute()
+        ), idempotent=False)
 
         print(f"✓ Created spreadsheet: {spreadsheet.get('spreadsheetUrl')}")
         return spreadsheet
@@ -105,6 +164,92 @@ def create_spreadsheet(title):
         raise
 
 
+def create_and_populate(title, rows, sheets_service=None):
+    """
+    Create a new Google Spreadsheet with its first sheet already filled in.
+
+    The values ride along in the spreadsheets.create payload, so the sheet
+    is created and written in a single API call.
+
+    Args:
+        title (str): Title for the new spreadsheet
+        rows (list): 2D list of values for the first sheet, starting at A1
+        sheets_service: Sheets service to use (defaults to get_sheets_service())
+
+    Returns:
+        dict: Spreadsheet metadata including ID and URL
+    """
+    try:
+        service = sheets_service or get_sheets_service()
+        spreadsheet = {
+            'properties': {
+                'title': title
+            },
+            'sheets': [{
+                'data': [{
+                    'rowData': [
+                        {'values': [
+                            {'userEnteredValue': {'stringValue': str(cell)}}
+                            for cell in row
+                        ]}
+                        for row in rows
+                    ]
+                }]
+            }]
+        }
+
+        spreadsheet = execute_with_retry(service.spreadsheets().create(
+            body=spreadsheet,
+            fields='spreadsheetId,spreadsheetUrl'
+        ), idempotent=False)
+
+        print(f"✓ Created spreadsheet with {len(rows)} rows: {spreadsheet.get('spreadsheetUrl')}")
+        return spreadsheet
+
+    except HttpError as error:
+        print(f"✗ Error creating spreadsheet: {error}")
+        raise
+
+
+def upload_rows_via_csv(rows, title, drive_service=None):
+    """
+    Create a Google Sheet by uploading the rows as a CSV file.
+
+    Drive converts the CSV into a spreadsheet, so large tables go up as one
+    compact request instead of a JSON payload of cell values.
+
+    Args:
+        rows (list): 2D list of values, header row first
+        title (str): Title for the new spreadsheet
+        drive_service: Drive service to use (defaults to get_drive_service())
+
+    Returns:
+        dict: Spreadsheet metadata including ID and URL
+    """
+    try:
+        buf = io.StringIO()
+        csv.writer(buf, quoting=csv.QUOTE_MINIMAL, lineterminator='\n').writerows(rows)
+        media = MediaInMemoryUpload(buf.getvalue().encode('utf-8'), mimetype='text/csv')
+
+        service = drive_service or get_drive_service()
+        created = execute_with_retry(service.files().create(
+            body={'name': title, 'mimeType': 'application/vnd.google-apps.spreadsheet'},
+            media_body=media,
+            fields='id,webViewLink'
+        ), idempotent=False)
+
+        spreadsheet = {
+            'spreadsheetId': created['id'],
+            'spreadsheetUrl': created['webViewLink']
+        }
+        print(f"✓ Uploaded {len(rows)} rows as CSV: {spreadsheet['spreadsheetUrl']}")
+        return spreadsheet
+
+    except HttpError as error:
+        print(f"✗ Error uploading CSV: {error}")
+        raise
+
+
 def write_to_sheet(spreadsheet_id, range_name, values):
     """
     Write values to a Google Sheet.
@@ -115,23 +260,39 @@ def write_to_sheet(spreadsheet_id, range_name, values):
         values (list): 2D list of values to write
 
     Returns:
-        dict: Update response
+        dict: Batch update response
+    """
+    return batch_write_to_sheet(spreadsheet_id, [(range_name, values)])
+
+
+def batch_write_to_sheet(spreadsheet_id, ranges):
+    """
+    Write several ranges to a Google Sheet in a single values.batchUpdate call.
+
+    Args:
+        spreadsheet_id (str): ID of the spreadsheet
+        ranges (list): List of (range_name, values) pairs
+
+    Returns:
+        dict: Batch update response
     """
     try:
         service = get_sheets_service()
 
         body = {
-            'values': values
+            'valueInputOption': 'RAW',
+            'data': [
+                {'range': range_name, 'values': values}
+                for range_name, values in ranges
+            ]
         }
 
-        result = service.spreadsheets().values().update(
+        result = execute_with_retry(service.spreadsheets().values().batchUpdate(
             spreadsheetId=spreadsheet_id,
-            range=range_name,
-            valueInputOption='RAW',
             body=body
-        ).execute()
+        ), idempotent=True)
 
-        print(f"✓ Updated {result.get('updatedCells')} cells")
+        print(f"✓ Updated {result.get('totalUpdatedCells')} cells")
         return result
 
     except HttpError as error:
@@ -153,10 +314,10 @@ def read_from_sheet(spreadsheet_id, range_name):
     try:
         service = get_sheets_service()
 
-        result = service.spreadsheets().values().get(
+        result = execute_with_retry(service.spreadsheets().values().get(
             spreadsheetId=spreadsheet_id,
             range=range_name
-        ).execute()
+        ), idempotent=True)
 
         values = result.get('values', [])
         print(f"✓ Read {len(values)} rows")
@@ -186,13 +347,13 @@ def append_to_sheet(spreadsheet_id, range_name, values):
             'values': values
         }
 
-        result = service.spreadsheets().values().append(
+        result = execute_with_retry(service.spreadsheets().values().append(
             spreadsheetId=spreadsheet_id,
             range=range_name,
             valueInputOption='RAW',
             insertDataOption='INSERT_ROWS',
             body=body
-        ).execute()
+        ), idempotent=False)
 
         print(f"✓ Appended {len(values)} rows")
         return result
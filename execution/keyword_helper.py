@@ -0,0 +1,62 @@
+"""
+Keyword classification helper.
+Finds which keyword categories occur in a block of text with a single scan,
+using an Aho-Corasick automaton when pyahocorasick is installed.
+"""
+
+import re
+
+# Aho-Corasick automaton for single-pass multi-keyword search (optional)
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+class KeywordMatcher:
+    """Match text against named keyword categories (plain substring matching)."""
+
+    def __init__(self, categories):
+        """
+        Build the matcher.
+
+        Args:
+            categories (dict): Category name -> list of keywords. A keyword may
+                appear in more than one category.
+        """
+        if ahocorasick is not None:
+            owners = {}
+            for category, keywords in categories.items():
+                for keyword in keywords:
+                    owners.setdefault(keyword, set()).add(category)
+
+            self.automaton = ahocorasick.Automaton()
+            for keyword, cats in owners.items():
+                self.automaton.add_word(keyword, frozenset(cats))
+            self.automaton.make_automaton()
+            self.patterns = None
+        else:
+            # Fallback: one alternation regex per category
+            self.automaton = None
+            self.patterns = {
+                category: re.compile('|'.join(map(re.escape, keywords)))
+                for category, keywords in categories.items()
+            }
+
+    def match(self, text):
+        """
+        Find the categories with at least one keyword in text.
+
+        Args:
+            text (str): Text to scan (callers pass it already lowercased)
+
+        Returns:
+            set: Names of matched categories
+        """
+        if self.automaton is not None:
+            found = set()
+            for _, cats in self.automaton.iter(text):
+                found |= cats
+            return found
+
+        return {category for category, pattern in self.patterns.items() if pattern.search(text)}
@@ -1,14 +1,23 @@
 """
 Persistent memory database manager for Claude Code.
 Stores and retrieves conversation insights with git versioning.
+
+Each memory is a git-versioned JSON file. Reads go through a single
+SQLite FTS5 index (memory.db); files added, removed or changed on disk
+(e.g. by a git pull) are re-indexed by mtime and size when it is opened.
 """
 
 import json
 import os
+import sqlite3
 from datetime import datetime
 from pathlib import Path
 import subprocess
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
+
+
+# Search order used for retrieval, matching the on-disk directories
+CATEGORIES = ["insights", "learnings", "patterns", "context_history"]
 
 
 class MemoryDatabase:
@@ -26,6 +35,96 @@ class MemoryDatabase:
                          self.patterns_dir, self.context_dir]:
             directory.mkdir(parents=True, exist_ok=True)
 
+        self.index_path = self.db_path / "memory.db"
+        self._conn = None
+
+    def _index(self) -> sqlite3.Connection:
+        """Open the FTS5 index, bringing it up to date with the JSON files."""
+        if self._conn is None:
+            self._conn = sqlite3.connect(str(self.index_path))
+            self._conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS mem USING fts5("
+                "id UNINDEXED, category UNINDEXED, tags, content, body UNINDEXED, "
+                "tokenize='porter unicode61')"
+            )
+            # mtime/size of each indexed file, to spot files edited on disk
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS files ("
+                "category TEXT, id TEXT, mtime_ns INTEGER, size INTEGER, "
+                "PRIMARY KEY (category, id))"
+            )
+            self.sync_index()
+        return self._conn
+
+    def sync_index(self):
+        """
+        Re-index JSON files that were added, removed or changed on disk
+        (e.g. by a git pull, revert or hand edit) since they were indexed.
+        """
+        conn = self._conn if self._conn is not None else self._index()
+
+        on_disk = {}
+        for category in CATEGORIES:
+            for file_path in (self.db_path / category).glob("*.json"):
+                try:
+                    stat = file_path.stat()
+                except OSError:
+                    continue
+                on_disk[(category, file_path.stem)] = (stat.st_mtime_ns, stat.st_size)
+
+        indexed = {
+            (category, memory_id): (mtime_ns, size)
+            for category, memory_id, mtime_ns, size
+            in conn.execute("SELECT category, id, mtime_ns, size FROM files")
+        }
+        if on_disk == indexed:
+            return
+
+        stale = (indexed.keys() - on_disk.keys()) | {
+            key for key, stat in on_disk.items() if indexed.get(key) != stat
+        }
+
+        rows = []
+        file_rows = []
+        for category, memory_id in stale:
+            if (category, memory_id) not in on_disk:
+                continue
+            file_path = self.db_path / category / f"{memory_id}.json"
+            try:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    memory = json.load(f)
+            except Exception as e:
+                print(f"Warning: Could not read {file_path}: {e}")
+                continue
+            rows.append(self._index_row(category, memory_id, memory))
+            file_rows.append((category, memory_id, *on_disk[(category, memory_id)]))
+
+        with conn:
+            if not indexed:
+                # First sync (or an index from before file tracking): start clean
+                conn.execute("DELETE FROM mem")
+            for category, memory_id in stale:
+                conn.execute("DELETE FROM mem WHERE category = ? AND id = ?", (category, memory_id))
+                conn.execute("DELETE FROM files WHERE category = ? AND id = ?", (category, memory_id))
+            conn.executemany("INSERT INTO mem VALUES (?, ?, ?, ?, ?)", rows)
+            conn.executemany("INSERT INTO files VALUES (?, ?, ?, ?)", file_rows)
+
+    @staticmethod
+    def _index_row(category: str, memory_id: str, memory: Dict) -> tuple:
+        """Build an index row (id, category, tags, content, body) for a memory."""
+        return (
+            memory_id,
+            category,
+            " ".join(memory.get("tags", [])),
+            json.dumps(memory.get("content", {}), ensure_ascii=False),
+            json.dumps(memory, ensure_ascii=False),
+        )
+
+    @staticmethod
+    def _fts_phrase(text: str) -> str:
+        """Quote text as a single FTS5 phrase so punctuation is not parsed."""
+        return '"' + text.replace('"', '""') + '"'
+
     def store_memory(self, category: str, content: Dict, tags: List[str] = None) -> str:
         """
         Store a memory in the database.
@@ -63,6 +162,17 @@ class MemoryDatabase:
         with open(file_path, 'w', encoding='utf-8') as f:
             json.dump(memory_data, f, indent=2, ensure_ascii=False)
 
+        # Index (same-second ids overwrite the file, so replace the row too)
+        conn = self._index()
+        with conn:
+            conn.execute("DELETE FROM mem WHERE category = ? AND id = ?",
+                         (target_dir.name, memory_id))
+            conn.execute("INSERT INTO mem VALUES (?, ?, ?, ?, ?)",
+                         self._index_row(target_dir.name, memory_id, memory_data))
+            stat = file_path.stat()
+            conn.execute("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)",
+                         (target_dir.name, memory_id, stat.st_mtime_ns, stat.st_size))
+
         # Git commit
         self._git_commit(file_path, f"Add {category}: {memory_id}")
 
@@ -82,40 +192,50 @@ class MemoryDatabase:
         Returns:
             List of memory dictionaries
         """
-        memories = []
+        return list(self.iter_memories(category=category, tags=tags, limit=limit))
+
+    def iter_memories(self, category: Optional[str] = None,
+                      tags: Optional[List[str]] = None,
+                      limit: int = 10) -> Iterator[Dict]:
+        """
+        Lazily yield memories, newest first within each category.
+
+        Same filters as retrieve_memories, but only one memory is held
+        in memory at a time.
+        """
+        if limit <= 0:
+            return
+
+        sql = "SELECT body FROM mem"
+        where, params = [], []
 
-        # Determine which directories to search
         if category:
-            dirs_to_search = [self.db_path / category]
-        else:
-            dirs_to_search = [self.insights_dir, self.learnings_dir,
-                            self.patterns_dir, self.context_dir]
-
-        # Read all memory files
-        for directory in dirs_to_search:
-            if not directory.exists():
-                continue
+            where.append("category = ?")
+            params.append(category)
 
-            for file_path in sorted(directory.glob("*.json"), reverse=True):
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        memory = json.load(f)
+        if tags:
+            # Narrow with FTS, then check exact tag membership below
+            where.append("tags MATCH ?")
+            params.append(" OR ".join(self._fts_phrase(tag) for tag in tags))
 
-                    # Filter by tags if specified
-                    if tags:
-                        if not any(tag in memory.get("tags", []) for tag in tags):
-                            continue
+        if where:
+            sql += " WHERE " + " AND ".join(where)
 
-                    memories.append(memory)
+        order = " ".join(f"WHEN '{c}' THEN {i}" for i, c in enumerate(CATEGORIES))
+        sql += f" ORDER BY CASE category {order} ELSE {len(CATEGORIES)} END, id DESC"
 
-                    if len(memories) >= limit:
-                        return memories
+        count = 0
+        for (body,) in self._index().execute(sql, params):
+            memory = json.loads(body)
 
-                except Exception as e:
-                    print(f"Warning: Could not read {file_path}: {e}")
-                    continue
+            if tags and not any(tag in memory.get("tags", []) for tag in tags):
+                continue
 
-        return memories
+            yield memory
+            count += 1
+
+            if count >= limit:
+                return
 
     def search_memories(self, query: str, limit: int = 5) -> List[Dict]:
         """
@@ -126,33 +246,16 @@ class MemoryDatabase:
             limit: Maximum results to return
 
         Returns:
-            List of matching memories
+            List of matching memories, best match first
         """
-        results = []
-        query_lower = query.lower()
-
-        for directory in [self.insights_dir, self.learnings_dir,
-                         self.patterns_dir, self.context_dir]:
-            if not directory.exists():
-                continue
-
-            for file_path in directory.glob("*.json"):
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        memory = json.load(f)
-
-                    # Search in content
-                    content_str = json.dumps(memory.get("content", {})).lower()
-                    if query_lower in content_str:
-                        results.append(memory)
-
-                        if len(results) >= limit:
-                            return results
-
-                except Exception:
-                    continue
-
-        return results
+        if not query.strip():
+            return []
+
+        cursor = self._index().execute(
+            "SELECT body FROM mem WHERE content MATCH ? ORDER BY rank LIMIT ?",
+            (self._fts_phrase(query), limit)
+        )
+        return [json.loads(body) for (body,) in cursor]
 
     def get_memory_summary(self) -> Dict:
         """
@@ -10,6 +10,17 @@ from pathlib import Path
 from typing import Dict, List, Optional
 import subprocess
 
+# Rows per bulk insert request (one round trip per batch instead of per memory)
+BULK_INSERT_SIZE = 500
+
+
+class BulkStoreError(Exception):
+    """A bulk store failed part-way; stored_ids are the rows already written."""
+
+    def __init__(self, message: str, stored_ids: List[str]):
+        super().__init__(message)
+        self.stored_ids = stored_ids
+
 
 class SupabaseMemoryDatabase:
     """Manages persistent memory storage using Supabase with local fallback."""
@@ -52,11 +63,10 @@ class SupabaseMemoryDatabase:
             return False
 
         try:
-            from supabase import create_client
-            self.supabase_client = create_client(supabase_url, supabase_key)
+            from supabase_helper import get_supabase
 
-            # Test connection by checking if table exists
-            self.supabase_client.table('memories').select('id', count='exact').limit(0).execute()
+            # Shared client; creating it also checks that the table exists
+            self.supabase_client = get_supabase()
             print("✓ Supabase connection established. Cloud storage enabled.")
             return True
         except ImportError:
@@ -110,6 +120,35 @@ class SupabaseMemoryDatabase:
         self.supabase_client.table(table).insert(data).execute()
         return data.get('id', 'unknown')
 
+    def _supabase_upsert_many(self, table: str, rows: List[Dict]) -> int:
+        """
+        Upsert rows (by id) into Supabase table in batches of BULK_INSERT_SIZE.
+
+        Rows whose id already exists are updated, so re-running a bulk store
+        is safe.
+
+        Args:
+            table: Table name
+            rows: Rows to write
+
+        Returns:
+            Number of rows written
+
+        Raises:
+            BulkStoreError: If a batch fails (stored_ids lists earlier batches)
+        """
+        if not self.supabase_available or not self.supabase_client:
+            raise BulkStoreError("Supabase not available", [])
+
+        for start in range(0, len(rows), BULK_INSERT_SIZE):
+            try:
+                self.supabase_client.table(table).upsert(
+                    rows[start:start + BULK_INSERT_SIZE], on_conflict='id'
+                ).execute()
+            except Exception as e:
+                raise BulkStoreError(str(e), [row['id'] for row in rows[:start]]) from e
+        return len(rows)
+
     def store_memory(self, category: str, content: Dict, tags: List[str] = None) -> str:
         """
         Store a memory in the database.
@@ -149,6 +188,59 @@ class SupabaseMemoryDatabase:
         # Fallback to local JSON
         return self._store_local(category, memory_data)
 
+    def store_memories(self, memories: List[Dict], fallback: bool = True) -> List[str]:
+        """
+        Store many memories at once.
+
+        Each entry needs 'category' and 'content'; 'tags', 'id' and
+        'created_at' are optional (existing ids and timestamps are kept,
+        so batches don't collide on the per-second default id).
+
+        Args:
+            memories: List of memory entries
+            fallback: Write to local JSON if Supabase fails. Pass False to
+                raise instead (e.g. when the entries were read from local JSON)
+
+        Returns:
+            List of stored memory IDs (or local file paths on fallback)
+
+        Raises:
+            BulkStoreError: With fallback=False, if not every row was stored
+        """
+        now = datetime.now()
+        rows = [
+            {
+                "id": memory.get('id') or f"{now.strftime('%Y%m%d_%H%M%S')}_{index}",
+                "created_at": memory.get('created_at') or now.isoformat(),
+                "category": memory['category'],
+                "tags": memory.get('tags') or [],
+                "content": memory['content'],
+                "transcript_length": memory['content'].get('transcript_length', 0),
+                "metadata": memory['content'].get('metadata', {})
+            }
+            for index, memory in enumerate(memories)
+        ]
+
+        stored_ids = []
+        if self.supabase_available:
+            try:
+                self._supabase_upsert_many('memories', rows)
+                print(f"✓ {len(rows)} memories stored in Supabase")
+                return [row['id'] for row in rows]
+            except BulkStoreError as e:
+                if not fallback:
+                    raise
+                stored_ids = e.stored_ids
+                print(f"⚠️  Supabase bulk storage failed after {len(stored_ids)} rows: {e}. "
+                      f"Falling back to local JSON.")
+                self.supabase_available = False
+
+        if not fallback:
+            raise BulkStoreError("Supabase not available", [])
+
+        # Only the rows that didn't reach Supabase go to local files
+        return stored_ids + [self._store_local(row['category'], row) for row in rows[len(stored_ids):]]
+
     def _store_local(self, category: str, memory_data: Dict) -> str:
         """Store memory locally as JSON file."""
         category_map = {
@@ -6,6 +6,7 @@ Loads relevant memories at conversation start.
 
 import sys
 import os
+from functools import lru_cache
 from pathlib import Path
 import json
 
@@ -13,6 +14,14 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from memory_database import MemoryDatabase
 
+# Printed on its own line after every reply in serve mode
+SERVE_END_MARKER = "--- END ---"
+
+@lru_cache(maxsize=1)
+def _get_db() -> MemoryDatabase:
+    """Return a process-wide MemoryDatabase so directories are set up once."""
+    return MemoryDatabase()
+
 
 def load_relevant_memories(query: str = None, limit: int = 5) -> str:
     """
@@ -25,48 +34,51 @@ def load_relevant_memories(query: str = None, limit: int = 5) -> str:
     Returns:
         str: Formatted memory context for Claude
     """
-    db = MemoryDatabase()
+    db = _get_db()
 
     # Get database summary
     summary = db.get_memory_summary()
 
     # Build context string
     context = []
-    context.append("=" * 60)
-    context.append("📚 PERSISTENT MEMORY CONTEXT")
-    context.append("=" * 60)
-    context.append("")
-    context.append(f"Total stored memories: {summary['total_memories']}")
-    context.append(f"  - Insights: {summary['insights']}")
-    context.append(f"  - Learnings: {summary['learnings']}")
-    context.append(f"  - Patterns: {summary['patterns']}")
-    context.append(f"  - Context history: {summary['context_history']}")
+    append = context.append
+    append(
+        f"{'=' * 60}\n"
+        f"📚 PERSISTENT MEMORY CONTEXT\n"
+        f"{'=' * 60}\n"
+        f"\n"
+        f"Total stored memories: {summary['total_memories']}\n"
+        f"  - Insights: {summary['insights']}\n"
+        f"  - Learnings: {summary['learnings']}\n"
+        f"  - Patterns: {summary['patterns']}\n"
+        f"  - Context history: {summary['context_history']}"
+    )
 
     if summary['last_updated']:
-        context.append(f"  - Last updated: {summary['last_updated']}")
+        append(f"  - Last updated: {summary['last_updated']}")
 
-    context.append("")
+    append("")
 
     # Retrieve relevant memories
     if query:
         memories = db.search_memories(query, limit=limit)
-        context.append(f"## Relevant Memories (query: '{query}'):")
+        append(f"## Relevant Memories (query: '{query}'):\n")
     else:
         memories = db.retrieve_memories(limit=limit)
-        context.append(f"## Recent Memories:")
-
-    context.append("")
+        append("## Recent Memories:\n")
 
     if not memories:
-        context.append("No stored memories found yet.")
+        append("No stored memories found yet.")
     else:
         for i, memory in enumerate(memories, 1):
-            context.append(f"### Memory {i}:")
-            context.append(f"**ID**: {memory.get('id', 'unknown')}")
-            context.append(f"**Timestamp**: {memory.get('timestamp', 'unknown')}")
+            append(
+                f"### Memory {i}:\n"
+                f"**ID**: {memory.get('id', 'unknown')}\n"
+                f"**Timestamp**: {memory.get('timestamp', 'unknown')}"
+            )
 
             if memory.get('tags'):
-                context.append(f"**Tags**: {', '.join(memory['tags'])}")
+                append(f"**Tags**: {', '.join(memory['tags'])}")
 
             content = memory.get('content', {})
 
@@ -75,36 +87,35 @@ def load_relevant_memories(query: str = None, limit: int = 5) -> str:
                 insights = content['insights']
 
                 if insights.get('summary'):
-                    context.append(f"**Summary**: {insights['summary']}")
+                    append(f"**Summary**: {insights['summary']}")
 
                 if insights.get('key_topics'):
                     topics = ', '.join(insights['key_topics'][:5])
-                    context.append(f"**Topics**: {topics}")
+                    append(f"**Topics**: {topics}")
 
                 if insights.get('learnings'):
-                    context.append(f"**Key Learnings**:")
+                    append(f"**Key Learnings**:")
                     for learning in insights['learnings'][:3]:
-                        context.append(f"  - {learning}")
+                        append(f"  - {learning}")
 
                 if insights.get('action_items'):
-                    context.append(f"**Action Items**:")
+                    append(f"**Action Items**:")
                     for action in insights['action_items'][:3]:
-                        context.append(f"  - {action}")
+                        append(f"  - {action}")
 
             # Display learnings if this is a learning memory
             elif 'learnings' in content:
-                context.append(f"**Learnings**:")
+                append(f"**Learnings**:")
                 for learning in content['learnings'][:5]:
-                    context.append(f"  - {learning}")
+                    append(f"  - {learning}")
 
             # Display patterns if this is a pattern memory
             elif 'code_patterns' in content:
-                context.append(f"**Code Patterns**: {len(content['code_patterns'])} patterns stored")
+                append(f"**Code Patterns**: {len(content['code_patterns'])} patterns stored")
 
-            context.append("")
+            append("")
 
-    context.append("=" * 60)
-    context.append("")
+    append("=" * 60 + "\n")
 
     return "\n".join(context)
 
@@ -120,7 +131,7 @@ def get_memory_by_topic(topic: str, limit: int = 3) -> str:
     Returns:
         str: Formatted memory results
     """
-    db = MemoryDatabase()
+    db = _get_db()
     memories = db.retrieve_memories(tags=[topic], limit=limit)
 
     if not memories:
@@ -140,27 +151,18 @@ def get_memory_by_topic(topic: str, limit: int = 3) -> str:
     return "\n".join(result)
 
 
-def export_memory_summary(output_file: str = None):
+def export_memory_summary(output_file: str = None, limit: int = 10):
     """
     Export a summary of all memories to a file.
 
+    Memories are streamed to disk one at a time rather than collected
+    into a single dict first, so peak memory stays flat for large stores.
+
     Args:
         output_file: Path to output file (optional)
+        limit: Maximum recent memories to include
     """
-    db = MemoryDatabase()
-
-    summary = {
-        "overview": db.get_memory_summary(),
-        "recent_memories": db.retrieve_memories(limit=10),
-        "all_tags": []
-    }
-
-    # Collect all unique tags
-    tags_set = set()
-    for memory in summary['recent_memories']:
-        tags_set.update(memory.get('tags', []))
-
-    summary['all_tags'] = sorted(list(tags_set))
+    db = _get_db()
 
     # Determine output location
     if not output_file:
@@ -169,50 +171,118 @@ def export_memory_summary(output_file: str = None):
     output_path = Path(output_file)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Write summary
+    # Collect all unique tags while streaming
+    tags_set = set()
+
     with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(summary, f, indent=2, ensure_ascii=False)
+        f.write('{\n  "overview": ')
+        f.write(_indent_json(db.get_memory_summary()))
+        f.write(',\n  "recent_memories": [')
+
+        for i, memory in enumerate(db.iter_memories(limit=limit)):
+            tags_set.update(memory.get('tags', []))
+            f.write(',\n    ' if i else '\n    ')
+            f.write(_indent_json(memory, level=2))
+
+        f.write('\n  ],\n  "all_tags": ')
+        f.write(_indent_json(sorted(tags_set)))
+        f.write('\n}')
 
     print(f"✓ Memory summary exported to: {output_path}")
 
     return str(output_path)
 
 
-def main():
-    """CLI interface."""
-    if len(sys.argv) < 2:
-        print("Memory Retrieval System")
-        print("\nUsage:")
-        print("  python memory_retrieval.py load [query]")
-        print("  python memory_retrieval.py topic <topic_name>")
-        print("  python memory_retrieval.py export [output_file]")
-        print("  python memory_retrieval.py summary")
-        sys.exit(0)
+def _indent_json(value, level: int = 1) -> str:
+    """Serialize value as indented JSON nested `level` deep in the export."""
+    text = json.dumps(value, indent=2, ensure_ascii=False)
+    return text.replace("\n", "\n" + "  " * level)
+
 
-    command = sys.argv[1]
+def run_command(args: list) -> int:
+    """
+    Run a single CLI command.
+
+    Args:
+        args: Command name followed by its arguments
+
+    Returns:
+        int: Exit status (0 on success)
+    """
+    command = args[0]
 
     if command == "load":
-        query = sys.argv[2] if len(sys.argv) > 2 else None
+        query = args[1] if len(args) > 1 else None
         context = load_relevant_memories(query)
         print(context)
 
-    elif command == "topic" and len(sys.argv) > 2:
-        topic = sys.argv[2]
+    elif command == "topic" and len(args) > 1:
+        topic = args[1]
         result = get_memory_by_topic(topic)
         print(result)
 
     elif command == "export":
-        output_file = sys.argv[2] if len(sys.argv) > 2 else None
+        output_file = args[1] if len(args) > 1 else None
         export_memory_summary(output_file)
 
     elif command == "summary":
-        db = MemoryDatabase()
+        db = _get_db()
         summary = db.get_memory_summary()
         print(json.dumps(summary, indent=2))
 
     else:
         print(f"Unknown command: {command}")
-        sys.exit(1)
+        return 1
+
+    return 0
+
+
+def serve():
+    """
+    Persistent mode: read one command per line from stdin.
+
+    Keeps the process (and the cached database) alive so repeated
+    lookups skip interpreter startup and database setup. The index is
+    re-synced with the memory files before every command, and each reply
+    ends with a SERVE_END_MARKER line so clients know where it stops.
+    """
+    for line in sys.stdin:
+        args = line.strip().split(maxsplit=1)
+        if not args:
+            continue
+        if args[0] in ("quit", "exit"):
+            break
+
+        try:
+            # Pick up memories added or edited on disk (e.g. by a git pull)
+            _get_db().sync_index()
+            run_command(args)
+        except Exception as e:
+            print(f"❌ Error running '{args[0]}': {e}")
+
+        print(SERVE_END_MARKER)
+        sys.stdout.flush()
+
+
+def main():
+    """CLI interface."""
+    if len(sys.argv) < 2:
+        print("Memory Retrieval System")
+        print("\nUsage:")
+        print("  python memory_retrieval.py load [query]")
+        print("  python memory_retrieval.py topic <topic_name>")
+        print("  python memory_retrieval.py export [output_file]")
+        print("  python memory_retrieval.py summary")
+        print("  python memory_retrieval.py serve   (read commands from stdin)")
+        sys.exit(0)
+
+    if sys.argv[1] in ("serve", "--persistent"):
+        serve()
+        return
+
+    status = run_command(sys.argv[1:])
+    if status:
+        sys.exit(status)
 
 
 if __name__ == "__main__":
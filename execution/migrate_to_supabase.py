@@ -11,7 +11,7 @@ from pathlib import Path
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from memory_database_supabase import SupabaseMemoryDatabase
+from memory_database_supabase import BulkStoreError, SupabaseMemoryDatabase
 
 
 def migrate_memories():
@@ -37,6 +37,10 @@ def migrate_memories():
     migrated_count = 0
     failed_count = 0
 
+    # Ids are per-second timestamps, so two categories can share one; the
+    # later category gets a deterministic suffix to keep re-runs idempotent
+    seen_ids = set()
+
     for category in categories:
         category_dir = local_dir / category
         if not category_dir.exists():
@@ -47,26 +51,47 @@ def migrate_memories():
 
         print(f"\n📁 Migrating {category} ({len(json_files)} files)...")
 
+        batch = []
         for json_file in json_files:
             try:
                 # Read local JSON
                 with open(json_file, 'r', encoding='utf-8') as f:
                     memory = json.load(f)
 
-                # Extract components
-                memory_id = memory.get('id')
-                tags = memory.get('tags', [])
-                content = memory.get('content', {})
-
-                # Store in Supabase
-                db.store_memory(category, content, tags)
+                memory_id = memory.get('id') or json_file.stem
+                if memory_id in seen_ids:
+                    memory_id = f"{memory_id}_{category}"
+                seen_ids.add(memory_id)
 
-                migrated_count += 1
-                print(f"   ✓ Migrated: {memory_id}")
+                # Extract components, keeping the original id and timestamp
+                batch.append({
+                    'id': memory_id,
+                    'created_at': memory.get('timestamp'),
+                    'category': category,
+                    'tags': memory.get('tags', []),
+                    'content': memory.get('content', {})
+                })
 
             except Exception as e:
                 failed_count += 1
-                print(f"   ❌ Failed to migrate {json_file.name}: {e}")
+                print(f"   ❌ Failed to read {json_file.name}: {e}")
+
+        if not batch:
+            continue
+
+        # Store the whole category in Supabase with bulk upserts (re-runs
+        # update existing rows). No local fallback: it would overwrite the
+        # very files being migrated.
+        try:
+            stored_ids = db.store_memories(batch, fallback=False)
+        except BulkStoreError as e:
+            stored_ids = e.stored_ids
+            print(f"   ❌ Failed to migrate {len(batch) - len(stored_ids)} of {len(batch)} in {category}: {e}")
+
+        for memory_id in stored_ids:
+            print(f"   ✓ Migrated: {memory_id}")
+        migrated_count += len(stored_ids)
+        failed_count += len(batch) - len(stored_ids)
 
     # Print summary
     print("\n" + "="*60)
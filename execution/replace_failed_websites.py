@@ -17,13 +17,36 @@ HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
 }
 
+# Generic role inboxes, ranked after personal addresses
+GENERIC_RE = re.compile(r'^(?:info|hello|contact|support|admin)@', re.IGNORECASE)
+
+# Enough of a landing page for email extraction
+MAX_BODY_BYTES = 256 * 1024
+
 def test_website(url, timeout=10):
     """Test if a website is live and accessible."""
     try:
-        response = requests.get(url, headers=HEADERS, timeout=timeout, verify=False, allow_redirects=True)
-        if response.status_code == 200:
-            return True, response.url, response.text
-        return False, None, None
+        # Cheap HEAD probe first so dead hosts never download a body
+        head = requests.head(url, headers=HEADERS, timeout=5, verify=False, allow_redirects=True)
+        if head.status_code not in (200, 405, 501):  # some servers reject HEAD
+            return False, None, None
+        
+        response = requests.get(head.url, headers=HEADERS, timeout=timeout, verify=False,
+                                allow_redirects=True, stream=True)
+        if response.status_code != 200:
+            response.close()
+            return False, None, None
+        
+        # Read at most MAX_BODY_BYTES of the body
+        body = b''
+        for chunk in response.iter_content(chunk_size=65536):
+            body += chunk
+            if len(body) >= MAX_BODY_BYTES:
+                break
+        response.close()
+        
+        text = body[:MAX_BODY_BYTES].decode(response.encoding or 'utf-8', errors='replace')
+        return True, response.url, text
     except:
         return False, None, None
 
@@ -33,9 +56,10 @@ def extract_emails(text):
     emails = list(set(re.findall(email_pattern, text)))
     
     # Filter decision maker emails
-    generic_patterns = ['info@', 'hello@', 'contact@', 'support@', 'admin@']
-    decision_maker = [e for e in emails if not any(p in e.lower() for p in generic_patterns)]
-    generic = [e for e in emails if any(p in e.lower() for p in generic_patterns)]
+    decision_maker = []
+    generic = []
+    for e in emails:
+        (generic if GENERIC_RE.match(e) else decision_maker).append(e)
     
     return (decision_maker + generic)[:2]
 
@@ -207,8 +231,7 @@ if __name__ == "__main__":
     csv_path = tmp_dir / 'b2b_cleaning_leads_final.csv'
     
     with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
-        writer.writerow([
+        writer = csv.DictWriter(f, fieldnames=[
             'Company Name',
             'Website',
             'Email 1',
@@ -217,17 +240,16 @@ if __name__ == "__main__":
             'Employee Count',
             'Notes'
         ])
-        
-        for lead in all_leads:
-            writer.writerow([
-                lead['name'],
-                lead['website'],
-                lead['email1'],
-                lead['email2'],
-                lead['focus'],
-                lead['employee_count'],
-                lead['notes']
-            ])
+        writer.writeheader()
+        writer.writerows({
+            'Company Name': lead['name'],
+            'Website': lead['website'],
+            'Email 1': lead['email1'],
+            'Email 2': lead['email2'],
+            'Focus (4 words max)': lead['focus'],
+            'Employee Count': lead['employee_count'],
+            'Notes': lead['notes']
+        } for lead in all_leads)
     
     print(f"✅ Saved to: {csv_path}\n")
     
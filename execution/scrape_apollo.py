@@ -5,6 +5,8 @@ Requires APOLLO_API_KEY in .env file.
 
 import sys
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from utils import (
     get_env_variable,
     save_json,
@@ -26,6 +28,29 @@ class ApolloScraper:
             'X-Api-Key': self.api_key
         }
 
+        # One pooled session so paginated calls reuse the TLS connection
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        # Rate limits (429) and 5xx are retried here with exponential
+        # backoff, sleeping for Retry-After when Apollo sends it
+        retries = Retry(
+            total=8,
+            backoff_factor=2,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=['POST'],
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=10,
+            max_retries=retries
+        ))
+
+    def close(self):
+        """Close the underlying HTTP session."""
+        self.session.close()
+
     def search_people(self, criteria):
         """
         Search for people based on criteria.
@@ -51,9 +76,8 @@ class ApolloScraper:
             criteria['per_page'] = 100
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 url,
-                headers=self.headers,
                 json=criteria,
                 timeout=30
             )
@@ -68,10 +92,7 @@ class ApolloScraper:
             return data
 
         except requests.exceptions.HTTPError as e:
-            if response.status_code == 429:
-                log_error("Rate limit exceeded", {'retry_after': response.headers.get('Retry-After')})
-            else:
-                log_error(f"HTTP error: {e}", {'status_code': response.status_code})
+            log_error(f"HTTP error: {e}", {'status_code': response.status_code})
             raise
 
         except requests.exceptions.RequestException as e:
@@ -88,16 +109,17 @@ class ApolloScraper:
         Returns:
             dict: Cleaned lead data
         """
+        org = person.get('organization') or {}
         return {
             'first_name': person.get('first_name', ''),
             'last_name': person.get('last_name', ''),
             'email': person.get('email', ''),
             'title': person.get('title', ''),
             'linkedin_url': person.get('linkedin_url', ''),
-            'company_name': person.get('organization', {}).get('name', ''),
-            'company_domain': person.get('organization', {}).get('primary_domain', ''),
-            'company_industry': person.get('organization', {}).get('industry', ''),
-            'company_size': person.get('organization', {}).get('estimated_num_employees', ''),
+            'company_name': org.get('name', ''),
+            'company_domain': org.get('primary_domain', ''),
+            'company_industry': org.get('industry', ''),
+            'company_size': org.get('estimated_num_employees', ''),
             'city': person.get('city', ''),
             'state': person.get('state', ''),
             'country': person.get('country', ''),
@@ -128,13 +150,9 @@ class ApolloScraper:
             if not people:
                 break
 
-            # Extract and add leads
-            for person in people:
-                lead = self.extract_lead_data(person)
-                all_leads.append(lead)
-
-                if len(all_leads) >= max_results:
-                    break
+            # Extract and add leads (only as many as still needed)
+            remaining = max_results - len(all_leads)
+            all_leads.extend([self.extract_lead_data(person) for person in people[:remaining]])
 
             # Check if there are more pages
             pagination = response.get('pagination', {})
@@ -163,7 +181,10 @@ def main():
     }
 
     scraper = ApolloScraper()
-    leads = scraper.scrape_leads(criteria, max_results=100)
+    try:
+        leads = scraper.scrape_leads(criteria, max_results=100)
+    finally:
+        scraper.close()
 
     print(f"\nScraped {len(leads)} leads")
     print(f"Sample lead: {leads[0] if leads else 'No leads found'}")
@@ -15,67 +15,184 @@ import os
 import re
 import time
 import json
-import requests
+import hashlib
+import io
+import httpx
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from bs4 import BeautifulSoup
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urlparse
 from pathlib import Path
 from google_sheets_helper import create_spreadsheet, write_to_sheet
+from utils import save_json
 
 # User agents for web scraping
 HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
 }
 
+# HTTP/2 needs the optional h2 package (httpx[http2]); fall back to HTTP/1.1 keep-alive
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Pages to check for contact information
+PAGE_PATTERNS = [
+    '/',  # Homepage
+    '/about',
+    '/about-us',
+    '/contact',
+    '/contact-us',
+    '/team',
+    '/our-team',
+    '/leadership',
+    '/management'
+]
+
+# Concurrent page fetches per host (kept low to stay polite)
+PAGE_WORKERS = 4
+
+# Companies (distinct hosts) processed in parallel; threads release
+# the GIL on socket I/O, so these overlap like async requests would
+COMPANY_WORKERS = 16
+
+# Every worker can hold a connection at once, so none waits on the pool;
+# pool waits are also left unbounded so a busy pool never drops a page.
+# A per-call timeout replaces this one entirely, so calls that need a
+# shorter timeout must pass their own httpx.Timeout(..., pool=None)
+POOL_SIZE = COMPANY_WORKERS * PAGE_WORKERS
+
+# Shared client: one pooled connection per host, multiplexed over HTTP/2 when
+# the server supports it, so a site's sub-pages share a single TLS handshake
+CLIENT = httpx.Client(
+    headers=HEADERS,
+    timeout=httpx.Timeout(10.0, pool=None),
+    follow_redirects=True,
+    transport=httpx.HTTPTransport(
+        http2=HTTP2_AVAILABLE,
+        retries=2,
+        limits=httpx.Limits(
+            max_connections=POOL_SIZE,
+            max_keepalive_connections=POOL_SIZE,
+            keepalive_expiry=60
+        )
+    )
+)
+
+# Maximum HTML read per page
+MAX_PAGE_BYTES = 64 * 1024
+
+# On-disk cache of scraped site text, keyed by URL
+WEB_CACHE_DIR = Path('.tmp/webcache')
+WEB_CACHE_TTL = 24 * 60 * 60  # seconds
+
+# Regexes used on every scraped page, compiled once
+# Every email, plus the role word (owner, ceo, ...) when one precedes it on the line
+EMAIL_RE = re.compile(
+    r'(?:(?P<role>owner|ceo|director|founder|managing|manager)[:\s][^@\n]{0,80}?)?'
+    r'\b(?P<email>[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,})\b',
+    re.IGNORECASE
+)
+
+# Role inboxes that are not decision makers
+GENERIC_EMAIL_PREFIXES = ('info@', 'hello@', 'contact@', 'support@', 'admin@', 'sales@')
+
+NAME_RES = [re.compile(p, re.IGNORECASE) for p in (
+    r'<title>([^<|]+)',
+    r'company name[:\s]+([A-Z][a-zA-Z\s&]+)',
+    r'welcome to ([A-Z][a-zA-Z\s&]+)'
+)]
+EMPLOYEE_RES = [re.compile(p) for p in (
+    r'(\d+)\+?\s*employees',
+    r'team of (\d+)',
+    r'(\d+)\s*staff members',
+    r'over (\d+)\s*people',
+    r'(\d+)\s*cleaners'
+)]
+OWNER_NAME_RES = [re.compile(p) for p in (
+    r'(?:owner|ceo|founder|director|managing director)[:\s]+([A-Z][a-z]+\s+[A-Z][a-z]+)',
+    r'([A-Z][a-z]+\s+[A-Z][a-z]+),\s*(?:owner|ceo|founder|director)',
+    r'contact\s+([A-Z][a-z]+\s+[A-Z][a-z]+)'
+)]
+DIGITS_RE = re.compile(r'\d+')
+
+# Keyword lists for classifying a site (matched against lowercased text)
+COMMERCIAL_KEYWORDS = [
+    'commercial cleaning', 'office cleaning', 'business cleaning',
+    'restaurant cleaning', 'medical practice', 'healthcare cleaning',
+    'industrial cleaning', 'corporate cleaning', 'workplace cleaning',
+    'retail cleaning', 'school cleaning', 'facility management'
+]
+RESIDENTIAL_KEYWORDS = [
+    'residential cleaning', 'home cleaning', 'house cleaning',
+    'domestic cleaning', 'maid service', 'housekeeping'
+]
+SERVICE_KEYWORDS = [
+    'office cleaning', 'carpet cleaning', 'window cleaning',
+    'floor cleaning', 'deep cleaning', 'sanitization',
+    'janitorial services', 'facility management', 'maintenance'
+]
+
+# One alternation over every keyword so the page text is scanned once
+KEYWORD_RE = re.compile('|'.join(
+    re.escape(kw) for kw in sorted(
+        set(COMMERCIAL_KEYWORDS + RESIDENTIAL_KEYWORDS + SERVICE_KEYWORDS),
+        key=len, reverse=True
+    )
+))
+
+
+# Known major SA commercial cleaning companies, always investigated
+SEED_COMPANIES = (
+    "https://www.tsebocleaning.co.za",
+    "https://www.bidvestnoonan.co.za",
+    "https://www.procare.co.za",
+    "https://www.kleenpro.co.za",
+    "https://www.cleaningservices.co.za",
+    "https://www.servicemaster.co.za",
+    "https://www.commercialclean.co.za",
+    "https://www.pristineclean.co.za",
+    "https://www.supremeclean.co.za",
+    "https://www.elitecleaning.co.za"
+)
+
 
 def search_google_for_companies(query, num_results=20):
     """
     Search Google for companies matching the query.
-    Returns list of URLs to investigate.
+    Returns list of URLs found in the results (seed companies are added by the caller).
     """
     print(f"\n🔍 Searching for: {query}")
 
-    # Manual search approach - we'll use a list of known SA cleaning companies
-    # and Google search results to build a candidate list
-
-    # Known major SA commercial cleaning companies to start with
-    seed_companies = [
-        "https://www.tsebocleaning.co.za",
-        "https://www.bidvestnoonan.co.za",
-        "https://www.procare.co.za",
-        "https://www.kleenpro.co.za",
-        "https://www.cleaningservices.co.za",
-        "https://www.servicemaster.co.za",
-        "https://www.commercialclean.co.za",
-        "https://www.pristineclean.co.za",
-        "https://www.supremeclean.co.za",
-        "https://www.elitecleaning.co.za"
-    ]
-
-    # Search Google via requests (scraping search results)
+    # Search Google via httpx (scraping search results)
     search_url = f"https://www.google.com/search?q={query.replace(' ', '+')}&num=20"
 
     try:
-        response = requests.get(search_url, headers=HEADERS, timeout=10)
-        soup = BeautifulSoup(response.text, 'html.parser')
+        response = CLIENT.get(search_url)
+        soup = BeautifulSoup(response.text, 'lxml')
 
-        # Extract URLs from search results
-        urls = []
+        # Extract URLs from search results (ordered set, stop at 15 unique)
+        unique = {}
         for link in soup.find_all('a'):
             href = link.get('href', '')
-            if '/url?q=' in href and 'google.com' not in href:
-                # Extract actual URL from Google's redirect
-                url = href.split('/url?q=')[1].split('&')[0]
-                if url.startswith('http') and '.co.za' in url:
-                    urls.append(url)
+            if '/url?q=' not in href or 'google.com' in href:
+                continue
+
+            # Extract actual URL from Google's redirect
+            url = href.split('/url?q=', 1)[1].split('&', 1)[0]
+            if url.startswith('http') and '.co.za' in url:
+                unique[url] = None
+                if len(unique) >= 15:
+                    break
 
-        # Combine with seed companies
-        all_urls = list(set(seed_companies + urls[:15]))
-        print(f"✓ Found {len(all_urls)} potential companies to investigate")
-        return all_urls
+        urls = list(unique)
+        print(f"✓ Found {len(urls)} potential companies to investigate")
+        return urls
 
     except Exception as e:
         print(f"⚠ Google search failed: {e}. Using seed companies only.")
-        return seed_companies
+        return []
 
 
 def scrape_website_content(url):
@@ -83,79 +200,165 @@ def scrape_website_content(url):
     Scrape key pages from a website to extract contact info and company details.
     Returns dict with page contents.
     """
+    cached = _load_cached_content(url)
+    if cached is not None:
+        print(f"\n📄 Using cached scrape: {url}")
+        return cached
+
     print(f"\n📄 Scraping: {url}")
 
+    # Parse the host once; page targets and the company name both derive from it
+    parsed = urlparse(url)
+    base = f"{parsed.scheme}://{parsed.netloc}"
+    targets = [f"{base}{pattern}" for pattern in PAGE_PATTERNS]
+
     content = {
         'base_url': url,
+        'netloc': parsed.netloc,
         'pages': {}
     }
 
-    # Pages to check for contact information
-    page_patterns = [
-        '/',  # Homepage
-        '/about',
-        '/about-us',
-        '/contact',
-        '/contact-us',
-        '/team',
-        '/our-team',
-        '/leadership',
-        '/management'
-    ]
+    with ThreadPoolExecutor(max_workers=PAGE_WORKERS) as executor:
+        # Cheap HEAD probe so missing pages (e.g. /about vs /about-us) cost no body
+        final_urls = list(executor.map(_probe_page, targets))
 
-    for pattern in page_patterns:
-        try:
-            full_url = urljoin(url, pattern)
-            response = requests.get(full_url, headers=HEADERS, timeout=10)
+        # Only GET live pages, once per canonical (post-redirect) URL
+        seen = set()
+        live = []
+        for pattern, final_url in zip(PAGE_PATTERNS, final_urls):
+            if final_url is None or final_url in seen:
+                continue
+            seen.add(final_url)
+            live.append((pattern, final_url))
 
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
+        texts = list(executor.map(lambda page: _fetch_page_text(*page), live))
 
-                # Remove script and style elements
-                for element in soup(['script', 'style', 'nav', 'footer']):
-                    element.decompose()
+    # Keep page order stable regardless of completion order
+    for (pattern, _), text in zip(live, texts):
+        if text is not None:
+            content['pages'][pattern] = text
 
-                # Get text content
-                text = soup.get_text(separator=' ', strip=True)
+    if content['pages']:
+        _save_cached_content(url, content)
 
-                # Limit text length to avoid token limits
-                text = text[:5000]
+    return content
 
-                content['pages'][pattern] = text
-                print(f"  ✓ Scraped {pattern}")
 
-                time.sleep(0.5)  # Be polite
+def _cache_path(url):
+    """Cache file for a URL."""
+    return WEB_CACHE_DIR / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.json"
 
-        except Exception as e:
-            print(f"  ⚠ Failed to scrape {pattern}: {str(e)[:50]}")
-            continue
 
-    return content
+def _load_cached_content(url):
+    """
+    Return cached scrape for url if it is younger than WEB_CACHE_TTL.
+    """
+    try:
+        with open(_cache_path(url), 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if time.time() - cached.get('ts', 0) >= WEB_CACHE_TTL:
+        return None
+
+    return cached.get('content')
+
+
+def _save_cached_content(url, content):
+    """Persist a scrape result for later runs."""
+    try:
+        WEB_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(_cache_path(url), 'w', encoding='utf-8') as f:
+            json.dump({'ts': time.time(), 'content': content}, f)
+    except OSError as e:
+        print(f"  ⚠ Could not cache {url}: {e}")
+
+
+def _probe_page(full_url):
+    """
+    HEAD-probe a page. Returns the final URL if it is worth a GET,
+    otherwise None.
+    """
+    try:
+        response = CLIENT.head(full_url, timeout=httpx.Timeout(5.0, pool=None))
+    except Exception:
+        return None
+
+    if response.status_code == 200:
+        return str(response.url)
+
+    # Some servers reject HEAD outright; let the GET decide
+    if response.status_code in (405, 501):
+        return full_url
+
+    return None
+
+
+def _fetch_page_text(pattern, full_url):
+    """
+    Fetch one page and return its visible text (None if unavailable).
+    """
+    try:
+        # Stream the body and stop early; 5000 chars of text never needs more
+        with CLIENT.stream('GET', full_url) as response:
+            if response.status_code != 200:
+                return None
+
+            body = bytearray()
+            for chunk in response.iter_bytes(chunk_size=8192):
+                body += chunk
+                if len(body) >= MAX_PAGE_BYTES:
+                    break
+
+            html = bytes(body).decode(response.encoding or 'utf-8', errors='replace')
+
+        soup = BeautifulSoup(html, 'lxml')
+
+        # Remove script and style elements
+        for element in soup(['script', 'style', 'nav', 'footer']):
+            element.decompose()
+
+        # Get text content
+        text = soup.get_text(separator=' ', strip=True)
+
+        # Limit text length to avoid token limits
+        text = text[:5000]
+
+        print(f"  ✓ Scraped {pattern}")
+        return text
+
+    except Exception as e:
+        print(f"  ⚠ Failed to scrape {pattern}: {str(e)[:50]}")
+        return None
 
 
 def extract_emails_from_text(text):
     """
     Extract email addresses from text using regex.
+    Role emails are those following an owner/director/CEO mention.
     """
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    emails = re.findall(email_pattern, text)
-
-    # Filter out common generic emails
-    generic_patterns = ['info@', 'hello@', 'contact@', 'support@', 'admin@', 'sales@']
+    # Dicts dedupe while keeping first-seen order, so the [:3] picks are stable
+    filtered_emails = {}
+    generic_emails = {}
+    role_emails = {}
 
-    filtered_emails = []
-    generic_emails = []
+    for match in EMAIL_RE.finditer(text):
+        email = match.group('email')
 
-    for email in emails:
-        is_generic = any(pattern in email.lower() for pattern in generic_patterns)
-        if is_generic:
-            generic_emails.append(email)
+        # Filter out common generic emails
+        if email.lower().startswith(GENERIC_EMAIL_PREFIXES):
+            generic_emails[email] = None
         else:
-            filtered_emails.append(email)
+            filtered_emails[email] = None
+
+        if match.group('role'):
+            role_emails[email.lower()] = None
 
     return {
-        'decision_maker_emails': list(set(filtered_emails)),
-        'generic_emails': list(set(generic_emails))
+        'decision_maker_emails': list(filtered_emails),
+        'generic_emails': list(generic_emails),
+        'role_emails': list(role_emails)
     }
 
 
@@ -166,7 +369,17 @@ def extract_company_info_manual(website_content, company_url):
     print(f"  🔍 Extracting company details...")
 
     # Combine all page content
-    all_text = "\n\n".join([f"=== {page} ===\n{content}" for page, content in website_content['pages'].items()])
+    # Built once into a single buffer; every extractor below reuses these two strings
+    buf = io.StringIO()
+    write = buf.write
+    for i, (page, content) in enumerate(website_content['pages'].items()):
+        if i:
+            write('\n\n')
+        write('=== ')
+        write(page)
+        write(' ===\n')
+        write(content)
+    all_text = buf.getvalue()
     all_text_lower = all_text.lower()
 
     company_info = {
@@ -182,49 +395,31 @@ def extract_company_info_manual(website_content, company_url):
     }
 
     # Extract company name from URL or title
-    domain = urlparse(company_url).netloc.replace('www.', '').replace('.co.za', '').replace('.com', '')
+    netloc = website_content.get('netloc') or urlparse(company_url).netloc
+    domain = netloc.replace('www.', '').replace('.co.za', '').replace('.com', '')
     company_info['company_name'] = domain.title()
 
     # Try to find actual company name in content
-    name_patterns = [
-        r'<title>([^<|]+)',
-        r'company name[:\s]+([A-Z][a-zA-Z\s&]+)',
-        r'welcome to ([A-Z][a-zA-Z\s&]+)'
-    ]
-    for pattern in name_patterns:
-        match = re.search(pattern, all_text, re.IGNORECASE)
+    for pattern in NAME_RES:
+        match = pattern.search(all_text)
         if match:
             name = match.group(1).strip()
             if len(name) > 3 and len(name) < 50:
                 company_info['company_name'] = name
                 break
 
+    # Find every classification keyword in a single pass
+    found_keywords = set(KEYWORD_RE.findall(all_text_lower))
+
     # Check if commercial cleaning (look for business-related keywords)
-    commercial_keywords = [
-        'commercial cleaning', 'office cleaning', 'business cleaning',
-        'restaurant cleaning', 'medical practice', 'healthcare cleaning',
-        'industrial cleaning', 'corporate cleaning', 'workplace cleaning',
-        'retail cleaning', 'school cleaning', 'facility management'
-    ]
-    company_info['is_commercial_cleaning'] = any(kw in all_text_lower for kw in commercial_keywords)
+    company_info['is_commercial_cleaning'] = not found_keywords.isdisjoint(COMMERCIAL_KEYWORDS)
 
     # Check if residential
-    residential_keywords = [
-        'residential cleaning', 'home cleaning', 'house cleaning',
-        'domestic cleaning', 'maid service', 'housekeeping'
-    ]
-    company_info['is_residential'] = any(kw in all_text_lower for kw in residential_keywords)
+    company_info['is_residential'] = not found_keywords.isdisjoint(RESIDENTIAL_KEYWORDS)
 
     # Extract employee count
-    employee_patterns = [
-        r'(\d+)\+?\s*employees',
-        r'team of (\d+)',
-        r'(\d+)\s*staff members',
-        r'over (\d+)\s*people',
-        r'(\d+)\s*cleaners'
-    ]
-    for pattern in employee_patterns:
-        match = re.search(pattern, all_text_lower)
+    for pattern in EMPLOYEE_RES:
+        match = pattern.search(all_text_lower)
         if match:
             company_info['employee_count'] = match.group(1)
             break
@@ -236,33 +431,22 @@ def extract_company_info_manual(website_content, company_url):
     # If no decision maker emails, try to find owner/manager emails specifically
     if not company_info['decision_maker_emails']:
         # Look for emails near owner/director/CEO mentions
-        owner_email_pattern = r'(?:owner|ceo|director|founder|managing|manager)[:\s]+.*?([a-z0-9._%+-]+@[a-z0-9.-]+\.[a-z]{2,})'
-        owner_emails = re.findall(owner_email_pattern, all_text_lower)
+        owner_emails = email_results['role_emails']
         if owner_emails:
-            company_info['decision_maker_emails'] = list(set(owner_emails))
+            company_info['decision_maker_emails'] = owner_emails
         else:
             # Fall back to generic emails if nothing else found
             company_info['decision_maker_emails'] = email_results['generic_emails'][:3]
 
     # Extract owner names
-    owner_patterns = [
-        r'(?:owner|ceo|founder|director|managing director)[:\s]+([A-Z][a-z]+\s+[A-Z][a-z]+)',
-        r'([A-Z][a-z]+\s+[A-Z][a-z]+),\s*(?:owner|ceo|founder|director)',
-        r'contact\s+([A-Z][a-z]+\s+[A-Z][a-z]+)'
-    ]
-    for pattern in owner_patterns:
-        matches = re.findall(pattern, all_text)
+    for pattern in OWNER_NAME_RES:
+        matches = pattern.findall(all_text)
         company_info['owner_names'].extend(matches)
 
-    company_info['owner_names'] = list(set(company_info['owner_names']))[:3]  # Limit to 3
+    company_info['owner_names'] = list(dict.fromkeys(company_info['owner_names']))[:3]  # Limit to 3
 
     # Extract services
-    service_keywords = [
-        'office cleaning', 'carpet cleaning', 'window cleaning',
-        'floor cleaning', 'deep cleaning', 'sanitization',
-        'janitorial services', 'facility management', 'maintenance'
-    ]
-    found_services = [svc for svc in service_keywords if svc in all_text_lower]
+    found_services = [svc for svc in SERVICE_KEYWORDS if svc in found_keywords]
     company_info['services'] = found_services[:5]
 
     print(f"  ✓ Extracted: {company_info['company_name']}")
@@ -291,7 +475,7 @@ def validate_lead(company_info):
     employee_count = company_info.get('employee_count', '').lower()
     if employee_count:
         # Extract numbers from employee count string
-        numbers = re.findall(r'\d+', employee_count)
+        numbers = DIGITS_RE.findall(employee_count)
         if numbers:
             count = int(numbers[0])
             if count < 5 or count > 100:
@@ -308,6 +492,42 @@ def validate_lead(company_info):
     return True, "Meets all criteria"
 
 
+def process_company(url):
+    """
+    Scrape, extract and validate a single company.
+    Returns company info for a valid lead, otherwise None.
+    """
+    print(f"\n{'=' * 60}")
+    print(f"Processing company: {url}")
+    print(f"{'=' * 60}")
+
+    # Scrape website
+    website_content = scrape_website_content(url)
+
+    if not website_content['pages']:
+        print(f"  ⚠ No content scraped for {url}, skipping...")
+        return None
+
+    # Extract info manually
+    company_info = extract_company_info_manual(website_content, url)
+
+    if not company_info:
+        print(f"  ⚠ Could not extract company info for {url}, skipping...")
+        return None
+
+    # Add website URL to company info
+    company_info['website'] = url
+
+    # Validate lead
+    is_valid, reason = validate_lead(company_info)
+
+    if not is_valid:
+        print(f"  ❌ INVALID ({url}): {reason}")
+        return None
+
+    return company_info
+
+
 def scrape_cleaning_companies(target_count=10):
     """
     Main function to scrape South African commercial cleaning companies.
@@ -323,13 +543,12 @@ def scrape_cleaning_companies(target_count=10):
         "office cleaning companies south africa"
     ]
 
-    all_urls = []
+    # Ordered dedup: seeds first, then new URLs from each query
+    seen = dict.fromkeys(SEED_COMPANIES)
     for query in search_queries:
-        urls = search_google_for_companies(query, num_results=10)
-        all_urls.extend(urls)
-
-    # Remove duplicates
-    all_urls = list(set(all_urls))
+        for url in search_google_for_companies(query, num_results=10):
+            seen.setdefault(url)
+    all_urls = list(seen)
     print(f"\n📊 Total unique companies to investigate: {len(all_urls)}")
 
     # Results storage
@@ -337,54 +556,47 @@ def scrape_cleaning_companies(target_count=10):
     tmp_dir = Path('.tmp')
     tmp_dir.mkdir(exist_ok=True)
 
-    # Process each company
-    for idx, url in enumerate(all_urls):
-        if len(valid_leads) >= target_count:
-            print(f"\n✅ Target of {target_count} valid leads reached!")
-            break
+    # Process companies in parallel; different hosts progress independently
+    executor = ThreadPoolExecutor(max_workers=max(1, min(COMPANY_WORKERS, len(all_urls))))
+    futures = {executor.submit(process_company, url): url for url in all_urls}
 
-        print(f"\n{'=' * 60}")
-        print(f"Processing company {idx + 1}/{len(all_urls)}: {url}")
-        print(f"Valid leads so far: {len(valid_leads)}/{target_count}")
-        print(f"{'=' * 60}")
+    # Intermediate results: one JSON line appended per lead
+    progress_file = open(tmp_dir / 'sa_cleaning_leads.jsonl', 'w', encoding='utf-8')
 
-        try:
-            # Scrape website
-            website_content = scrape_website_content(url)
+    try:
+        for future in as_completed(futures):
+            url = futures[future]
 
-            if not website_content['pages']:
-                print(f"  ⚠ No content scraped, skipping...")
+            try:
+                company_info = future.result()
+            except Exception as e:
+                print(f"  ✗ Error processing {url}: {e}")
                 continue
 
-            # Extract info manually
-            company_info = extract_company_info_manual(website_content, url)
-
-            if not company_info:
-                print(f"  ⚠ Could not extract company info, skipping...")
+            if company_info is None:
                 continue
 
-            # Add website URL to company info
-            company_info['website'] = url
+            print(f"  ✅ VALID LEAD: {company_info.get('company_name')}")
+            print(f"     Emails: {', '.join(company_info.get('decision_maker_emails', []))}")
+            valid_leads.append(company_info)
+            print(f"Valid leads so far: {len(valid_leads)}/{target_count}")
 
-            # Validate lead
-            is_valid, reason = validate_lead(company_info)
+            # Save intermediate results
+            progress_file.write(json.dumps(company_info) + '\n')
+            progress_file.flush()
 
-            if is_valid:
-                print(f"  ✅ VALID LEAD: {company_info.get('company_name')}")
-                print(f"     Emails: {', '.join(company_info.get('decision_maker_emails', []))}")
-                valid_leads.append(company_info)
-
-                # Save intermediate results
-                with open(tmp_dir / 'sa_cleaning_leads.json', 'w') as f:
-                    json.dump(valid_leads, f, indent=2)
-            else:
-                print(f"  ❌ INVALID: {reason}")
-
-            time.sleep(1)  # Be respectful with scraping
-
-        except Exception as e:
-            print(f"  ✗ Error processing {url}: {e}")
-            continue
+            if len(valid_leads) >= target_count:
+                print(f"\n✅ Target of {target_count} valid leads reached!")
+                break
+    finally:
+        # Drop companies that have not started yet
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=True)
+        progress_file.close()
+
+    # Final snapshot
+    save_json(valid_leads, 'sa_cleaning_leads.json')
 
     print(f"\n{'=' * 60}")
     print(f"🎯 SCRAPING COMPLETE")
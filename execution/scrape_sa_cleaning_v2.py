@@ -6,11 +6,14 @@ Uses concurrent processing and improved detection logic.
 import re
 import time
 import json
-import requests
-from bs4 import BeautifulSoup
+import socket
+import threading
+from collections import OrderedDict, defaultdict
+import httpx
+from bs4 import BeautifulSoup, SoupStrainer
 from urllib.parse import urljoin, urlparse
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 import csv
 
 # User agents for web scraping
@@ -18,6 +21,143 @@ HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
 }
 
+# Process-wide DNS cache: every worker resolving the same host within
+# DNS_CACHE_TTL seconds reuses the first lookup instead of a new round trip
+DNS_CACHE_TTL = 300
+_dns_cache = {}
+_dns_lock = threading.Lock()
+_original_getaddrinfo = socket.getaddrinfo
+
+
+def _cached_getaddrinfo(*args, **kwargs):
+    key = (args, tuple(sorted(kwargs.items())))
+    now = time.monotonic()
+
+    with _dns_lock:
+        cached = _dns_cache.get(key)
+    if cached and now - cached[0] < DNS_CACHE_TTL:
+        return cached[1]
+
+    result = _original_getaddrinfo(*args, **kwargs)  # failures are not cached
+    with _dns_lock:
+        _dns_cache[key] = (now, result)
+    return result
+
+
+socket.getaddrinfo = _cached_getaddrinfo
+
+# HTTP/2 needs the optional h2 package (httpx[http2]); fall back to HTTP/1.1 keep-alive
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# One client shared by all workers: its connection pool is thread-safe, so
+# every worker reuses warm connections and no socket is pinned per thread
+CLIENT = httpx.Client(
+    headers=HEADERS,
+    timeout=8.0,
+    verify=False,
+    follow_redirects=True,
+    transport=httpx.HTTPTransport(
+        http2=HTTP2_AVAILABLE,
+        verify=False,
+        retries=2,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=40)
+    )
+)
+
+
+# One pattern for every per-page signal; m.lastgroup says which one hit.
+# Employee phrases match in any case; role words only in lowercase and
+# owner names must be capitalised.
+SIGNAL_RE = re.compile(
+    r'(?P<email>\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b)'
+    r'|(?P<employees>(?i:(\d+)\+?\s*employees|team of (\d+)|(\d+)\s*staff|over (\d+)\s*people))'
+    r'|(?:ceo|director|founder|owner|managing director)[:\s]+(?P<owner>[A-Z][a-z]+\s+[A-Z][a-z]+)'
+    r'|(?P<owner_before_role>[A-Z][a-z]+\s+[A-Z][a-z]+),\s*(?:ceo|director|founder|owner)'
+)
+
+# Groups of the employee phrases inside SIGNAL_RE, in priority order
+# ("employees" beats "team of" beats "staff" beats "people")
+EMPLOYEE_GROUPS = range(3, 7)
+
+# Keyword lists, each matched with one alternation pass over the text
+COMMERCIAL_KEYWORDS = [
+    'commercial', 'office', 'business', 'corporate', 'industrial',
+    'restaurant', 'medical', 'healthcare', 'retail', 'school',
+    'facility', 'workplace', 'premises', 'building'
+]
+RESIDENTIAL_KEYWORDS = ['residential', 'home cleaning', 'house cleaning', 'domestic worker', 'maid service']
+COMMERCIAL_RE = re.compile('|'.join(map(re.escape, COMMERCIAL_KEYWORDS)), re.IGNORECASE)
+RESIDENTIAL_RE = re.compile('|'.join(map(re.escape, RESIDENTIAL_KEYWORDS)), re.IGNORECASE)
+
+
+# Columns of the CSV backup
+CSV_HEADERS = (
+    'Company Name',
+    'Website',
+    'Email 1',
+    'Email 2',
+    'Email 3',
+    'Owner/Directors',
+    'Employee Count',
+    'Commercial Cleaning',
+    'Valid Lead',
+    'Notes'
+)
+
+# Columns of the Google Sheet export
+SHEET_HEADERS = [
+    'Company Name',
+    'Website',
+    'Email 1',
+    'Email 2',
+    'Email 3',
+    'Owner/Directors',
+    'Employee Count',
+    'Commercial Cleaning',
+    'Notes'
+]
+
+# Valid leads buffered before each values.append call while streaming
+SHEET_BATCH_SIZE = 50
+
+# Generic inboxes, used only as a fallback to decision-maker emails
+GENERIC_PATTERNS = ['info@', 'hello@', 'contact@', 'support@', 'admin@', 'sales@', 'enquiries@', 'reception@']
+
+# Maximum HTML read per page; only 3000 chars of text are kept
+MAX_PAGE_BYTES = 128 * 1024
+
+# Per-URL page results: in-flight downloads are shared between workers,
+# finished ones are kept (LRU) so duplicate URLs are not fetched again
+PAGE_CACHE_SIZE = 256
+_PAGE_RESULTS = OrderedDict()
+_PAGE_LOCK = threading.Lock()
+
+# Politeness cap on simultaneous requests to any one host, so the global
+# worker pool can run hot without hammering a single site
+PER_HOST_LIMIT = 4
+_HOST_SEMAPHORES = defaultdict(lambda: threading.Semaphore(PER_HOST_LIMIT))
+_HOST_LOCK = threading.Lock()
+
+# Only build the <body> subtree when parsing pages
+BODY_ONLY = SoupStrainer('body')
+
+# Boilerplate tags stripped before extracting page text
+DECOMPOSE_TAGS = frozenset({'script', 'style', 'nav', 'footer', 'header'})
+
+# Pages fetched per company, most informative first
+PAGE_PATHS = ['/', '/contact', '/contact-us', '/about']
+
+
+def is_generic_email(email):
+    """Return True for role inboxes such as info@ or sales@."""
+    email_lower = email.lower()
+    return any(pattern in email_lower for pattern in GENERIC_PATTERNS)
+
+
 # Verified list of South African commercial cleaning companies
 SA_COMMERCIAL_CLEANERS = [
     # Major commercial cleaning companies
@@ -44,6 +184,104 @@ SA_COMMERCIAL_CLEANERS = [
 ]
 
 
+def _fetch_page_text(url, page_path):
+    """
+    Fetch one page of a site and return its visible text (None on failure).
+
+    Concurrent requests for the same URL share a single download, and
+    recent results are reused for the rest of the run.
+    """
+    full_url = urljoin(url, page_path)
+
+    with _PAGE_LOCK:
+        future = _PAGE_RESULTS.get(full_url)
+        is_owner = future is None
+        if is_owner:
+            future = Future()
+            _PAGE_RESULTS[full_url] = future
+            _evict_page_results()
+        else:
+            _PAGE_RESULTS.move_to_end(full_url)
+
+    if is_owner:
+        future.set_result(_download_page_text(full_url))
+
+    return future.result()
+
+
+def _evict_page_results():
+    """Drop the oldest finished results beyond PAGE_CACHE_SIZE (caller holds _PAGE_LOCK)."""
+    while len(_PAGE_RESULTS) > PAGE_CACHE_SIZE:
+        oldest_url, oldest = next(iter(_PAGE_RESULTS.items()))
+        if not oldest.done():
+            break
+        del _PAGE_RESULTS[oldest_url]
+
+
+def _download_page_text(full_url):
+    """
+    Download one page and return its visible text (None on failure).
+    """
+    with _HOST_LOCK:
+        host_slot = _HOST_SEMAPHORES[urlparse(full_url).netloc]
+
+    try:
+        # Stream and stop after MAX_PAGE_BYTES; the connection goes back to the pool
+        with host_slot, CLIENT.stream('GET', full_url) as response:
+            if response.status_code != 200:
+                return None
+            if 'html' not in response.headers.get('Content-Type', ''):
+                return None
+
+            body = bytearray()
+            for chunk in response.iter_bytes(chunk_size=16384):
+                body += chunk
+                if len(body) >= MAX_PAGE_BYTES:
+                    break
+
+            html = bytes(body).decode(response.encoding or 'utf-8', errors='replace')
+
+        # C parser, and only the <body> subtree is built (skips <head> scripts/styles)
+        soup = BeautifulSoup(html, 'lxml', parse_only=BODY_ONLY)
+
+        # Remove unwanted elements
+        for element in soup.find_all(DECOMPOSE_TAGS):
+            element.decompose()
+
+        return soup.get_text(separator=' ', strip=True)[:3000]  # Limit size
+
+    except Exception:
+        return None
+
+
+def _update_signals(signals, text):
+    """Fold one page's emails, employee count, owners and commercial match into signals."""
+    for match in SIGNAL_RE.finditer(text):
+        kind = match.lastgroup
+        if kind == 'email':
+            signals['emails'][match.group('email')] = None
+        elif kind == 'employees':
+            # Keep the first hit of each phrase; the highest-priority one wins later
+            counts = signals['employee_counts']
+            for slot, group in enumerate(EMPLOYEE_GROUPS):
+                if match.group(group) and counts[slot] is None:
+                    counts[slot] = match.group(group)
+        else:
+            name = match.group(kind)
+            if name not in signals['owner_names']:
+                signals['owner_names'].append(name)
+
+    # Commercial check is lenient: most companies in our list are
+    if not signals['is_commercial']:
+        signals['is_commercial'] = COMMERCIAL_RE.search(text) is not None
+
+
+def _has_enough_signal(signals):
+    """True once 3+ decision-maker emails, a commercial match and an owner are known."""
+    decision_maker_count = sum(1 for e in signals['emails'] if not is_generic_email(e))
+    return decision_maker_count >= 3 and signals['is_commercial'] and bool(signals['owner_names'])
+
+
 def quick_scrape_site(company):
     """
     Quickly scrape a single company's website for contact info.
@@ -55,28 +293,34 @@ def quick_scrape_site(company):
     print(f"  🔍 {name}...")
 
     try:
-        # Try to scrape homepage and contact page
+        # Homepage first; if it already gives enough signal to judge the
+        # lead, skip the rest, otherwise fetch the other pages in parallel
         pages_content = []
+        # emails is a dict used as an insertion-ordered set
+        signals = {
+            'emails': {},
+            'employee_counts': [None] * len(EMPLOYEE_GROUPS),
+            'owner_names': [],
+            'is_commercial': False
+        }
 
-        for page_path in ['/', '/contact', '/contact-us', '/about']:
-            try:
-                full_url = urljoin(url, page_path)
-                response = requests.get(full_url, headers=HEADERS, timeout=8, verify=False)
-
-                if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, 'html.parser')
-
-                    # Remove unwanted elements
-                    for element in soup(['script', 'style', 'nav', 'footer', 'header']):
-                        element.decompose()
+        homepage = _fetch_page_text(url, PAGE_PATHS[0])
+        if homepage is not None:
+            pages_content.append(homepage)
+            _update_signals(signals, homepage)
 
-                    text = soup.get_text(separator=' ', strip=True)
-                    pages_content.append(text[:3000])  # Limit size
+        if not _has_enough_signal(signals):
+            other_paths = PAGE_PATHS[1:]
+            with ThreadPoolExecutor(max_workers=len(other_paths)) as inner:
+                texts = list(inner.map(lambda path: _fetch_page_text(url, path), other_paths))
 
-                    time.sleep(0.3)  # Brief pause
+            for text in texts:
+                if text is not None:
+                    pages_content.append(text)
+                    _update_signals(signals, text)
 
-            except:
-                continue
+        emails = signals['emails']
+        is_commercial = signals['is_commercial']
 
         if not pages_content:
             print(f"    ❌ No content scraped")
@@ -84,21 +328,13 @@ def quick_scrape_site(company):
 
         # Combine all content
         all_text = " ".join(pages_content)
-        all_text_lower = all_text.lower()
-
-        # Extract emails
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        all_emails = list(set(re.findall(email_pattern, all_text)))
 
         # Separate decision maker vs generic emails
-        generic_patterns = ['info@', 'hello@', 'contact@', 'support@', 'admin@', 'sales@', 'enquiries@', 'reception@']
-
         decision_maker_emails = []
         generic_emails = []
 
-        for email in all_emails:
-            email_lower = email.lower()
-            if any(pattern in email_lower for pattern in generic_patterns):
+        for email in emails:
+            if is_generic_email(email):
                 generic_emails.append(email)
             else:
                 decision_maker_emails.append(email)
@@ -106,44 +342,13 @@ def quick_scrape_site(company):
         # Prefer decision maker emails, fall back to generic
         final_emails = decision_maker_emails[:3] if decision_maker_emails else generic_emails[:2]
 
-        # Check if it's commercial (most companies in our list are, so be lenient)
-        commercial_keywords = [
-            'commercial', 'office', 'business', 'corporate', 'industrial',
-            'restaurant', 'medical', 'healthcare', 'retail', 'school',
-            'facility', 'workplace', 'premises', 'building'
-        ]
-        is_commercial = any(kw in all_text_lower for kw in commercial_keywords)
-
         # Check if residential (reject if primarily residential)
-        residential_keywords = ['residential', 'home cleaning', 'house cleaning', 'domestic worker', 'maid service']
-        residential_count = sum(1 for kw in residential_keywords if kw in all_text_lower)
+        residential_count = len({kw.lower() for kw in RESIDENTIAL_RE.findall(all_text)})
         is_residential_focused = residential_count >= 2
 
-        # Extract employee count
-        employee_count = "Unknown"
-        employee_patterns = [
-            r'(\d+)\+?\s*employees',
-            r'team of (\d+)',
-            r'(\d+)\s*staff',
-            r'over (\d+)\s*people',
-        ]
-        for pattern in employee_patterns:
-            match = re.search(pattern, all_text_lower)
-            if match:
-                employee_count = match.group(1) + "+"
-                break
-
-        # Extract owner/director names
-        owner_names = []
-        owner_patterns = [
-            r'(?:ceo|director|founder|owner|managing director)[:\s]+([A-Z][a-z]+\s+[A-Z][a-z]+)',
-            r'([A-Z][a-z]+\s+[A-Z][a-z]+),\s*(?:ceo|director|founder|owner)',
-        ]
-        for pattern in owner_patterns:
-            matches = re.findall(pattern, all_text)
-            owner_names.extend(matches[:2])
-
-        owner_names = list(set(owner_names))[:3]
+        # Employee count and owner/director names came from the same page walk
+        employee_count = next((c + "+" for c in signals['employee_counts'] if c), "Unknown")
+        owner_names = signals['owner_names'][:3]
 
         # Determine if valid
         has_contact = len(final_emails) > 0
@@ -179,10 +384,29 @@ def quick_scrape_site(company):
         return None
 
 
-def scrape_companies_concurrent(companies, max_workers=5):
+def scrape_companies_concurrent(companies, max_workers=None, csv_out=None, export_sheet=False):
     """
     Scrape multiple companies concurrently for speed.
+
+    The work is network-bound (threads release the GIL while waiting), so
+    throughput grows almost linearly with workers until bandwidth or the
+    remote hosts saturate. With one host per company there is no gain past
+    one worker per company, hence the default of min(len(companies), 32);
+    PER_HOST_LIMIT keeps each individual site polite.
+
+    Valid leads are streamed as they complete: written (and flushed) to
+    csv_out, an open CSV file, and, with export_sheet, appended to a Google
+    Sheet in batches of SHEET_BATCH_SIZE, so partial results survive an
+    interrupted run. The sheet is only created once the first valid lead
+    arrives.
+
+    Returns:
+        tuple: (results, spreadsheet) where spreadsheet is None unless every
+            valid lead reached the sheet
     """
+    if max_workers is None:
+        max_workers = max(1, min(len(companies), 32))
+
     print("\n" + "=" * 70)
     print("🧹 SA COMMERCIAL CLEANING COMPANY SCRAPER V2")
     print("=" * 70)
@@ -190,6 +414,10 @@ def scrape_companies_concurrent(companies, max_workers=5):
 
     results = []
     valid_count = 0
+    writer = csv.writer(csv_out) if csv_out is not None else None
+    spreadsheet = None
+    sheet_ok = export_sheet
+    pending_rows = []
 
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
         future_to_company = {executor.submit(quick_scrape_site, company): company for company in companies}
@@ -201,123 +429,85 @@ def scrape_companies_concurrent(companies, max_workers=5):
                 if result['is_valid']:
                     valid_count += 1
 
+                    if writer is not None:
+                        writer.writerow(_lead_row(result))
+                        csv_out.flush()
+
+                    if sheet_ok:
+                        pending_rows.append(_lead_row(result, valid_column=False))
+                        if spreadsheet is None:
+                            spreadsheet = start_google_sheet()
+                            sheet_ok = spreadsheet is not None
+                        if sheet_ok and len(pending_rows) >= SHEET_BATCH_SIZE:
+                            sheet_ok = _append_sheet_rows(spreadsheet, pending_rows)
+                            pending_rows = []
+
+    if sheet_ok and pending_rows:
+        sheet_ok = _append_sheet_rows(spreadsheet, pending_rows)
+
     print(f"\n{'=' * 70}")
     print(f"✅ Scraping complete: {valid_count} valid leads from {len(results)} processed")
     print(f"{'=' * 70}\n")
 
-    return results
+    return results, spreadsheet if sheet_ok else None
 
 
-def save_to_csv(results, filename='sa_cleaning_leads.csv'):
-    """
-    Save results to CSV file as backup/intermediate format.
+def _lead_row(lead, valid_column=True):
     """
-    tmp_dir = Path('.tmp')
-    tmp_dir.mkdir(exist_ok=True)
+    Output row for a lead; emails padded/truncated to exactly 3 columns.
 
-    filepath = tmp_dir / filename
-
-    with open(filepath, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
-
-        # Write header
-        writer.writerow([
-            'Company Name',
-            'Website',
-            'Email 1',
-            'Email 2',
-            'Email 3',
-            'Owner/Directors',
-            'Employee Count',
-            'Commercial Cleaning',
-            'Valid Lead',
-            'Notes'
-        ])
-
-        # Write data
-        for r in results:
-            if r['is_valid']:  # Only include valid leads
-                emails = r['emails'] + [''] * (3 - len(r['emails']))  # Pad to 3 emails
-                writer.writerow([
-                    r['company_name'],
-                    r['website'],
-                    emails[0] if len(emails) > 0 else '',
-                    emails[1] if len(emails) > 1 else '',
-                    emails[2] if len(emails) > 2 else '',
-                    ', '.join(r['owner_names']) if r['owner_names'] else 'Not found',
-                    r['employee_count'],
-                    'Yes' if r['is_commercial'] else 'No',
-                    'Yes' if r['is_valid'] else 'No',
-                    '; '.join(r['validation_notes']) if r['validation_notes'] else 'Meets criteria'
-                ])
-
-    print(f"✅ Results saved to: {filepath}")
-    return filepath
-
-
-def export_to_google_sheets(results):
-    """
-    Export results to Google Sheets (requires credentials).
+    Args:
+        lead (dict): Result from quick_scrape_site
+        valid_column (bool): Include the 'Valid Lead' column (CSV_HEADERS);
+            without it the row matches SHEET_HEADERS
+
+    Returns:
+        list: Row values
     """
+    row = [
+        lead['company_name'],
+        lead['website'],
+        *(lead['emails'] + [''] * 3)[:3],
+        ', '.join(lead['owner_names']) or 'Not found',
+        lead['employee_count'],
+        'Yes' if lead['is_commercial'] else 'No'
+    ]
+    if valid_column:
+        row.append('Yes' if lead['is_valid'] else 'No')
+    # CSV and sheet have always used different wording for a clean lead
+    default_note = 'Meets criteria' if valid_column else 'Meets all criteria'
+    row.append('; '.join(lead['validation_notes']) or default_note)
+    return row
+
+
+def _append_sheet_rows(spreadsheet, rows):
+    """Append a batch of rows to the streamed sheet. Returns False on failure."""
     try:
-        from google_sheets_helper import create_spreadsheet, write_to_sheet
+        from google_sheets_helper import append_to_sheet
 
-        print("\n📊 Exporting to Google Sheets...")
+        append_to_sheet(spreadsheet['spreadsheetId'], 'Sheet1', rows)
+        return True
 
-        # Filter to valid leads only
-        valid_leads = [r for r in results if r['is_valid']]
+    except Exception as e:
+        print(f"\n⚠️  Google Sheets append failed: {e}")
+        print(f"    The sheet is incomplete: {spreadsheet['spreadsheetUrl']}")
+        print("    Remaining results go to the CSV file only.")
+        return False
 
-        if not valid_leads:
-            print("❌ No valid leads to export")
-            return None
 
-        # Create spreadsheet
+def start_google_sheet():
+    """
+    Create an empty lead sheet (header row only) for streaming results into.
+    Returns the spreadsheet, or None if Google Sheets is unavailable.
+    """
+    try:
+        from google_sheets_helper import create_and_populate
+
+        print("\n📊 Creating Google Sheet for streamed results...")
+
         sheet_title = f"SA Commercial Cleaning Leads - {time.strftime('%Y-%m-%d %H:%M')}"
-        spreadsheet = create_spreadsheet(sheet_title)
-        spreadsheet_id = spreadsheet['spreadsheetId']
-
-        # Prepare data
-        headers = [
-            'Company Name',
-            'Website',
-            'Email 1',
-            'Email 2',
-            'Email 3',
-            'Owner/Directors',
-            'Employee Count',
-            'Commercial Cleaning',
-            'Notes'
-        ]
-
-        rows = [headers]
-
-        for lead in valid_leads:
-            emails = lead['emails'] + [''] * (3 - len(lead['emails']))
-            row = [
-                lead['company_name'],
-                lead['website'],
-                emails[0] if len(emails) > 0 else '',
-                emails[1] if len(emails) > 1 else '',
-                emails[2] if len(emails) > 2 else '',
-                ', '.join(lead['owner_names']) if lead['owner_names'] else 'Not found',
-                lead['employee_count'],
-                'Yes' if lead['is_commercial'] else 'No',
-                '; '.join(lead['validation_notes']) if lead['validation_notes'] else 'Meets all criteria'
-            ]
-            rows.append(row)
-
-        # Write to sheet
-        write_to_sheet(spreadsheet_id, 'Sheet1!A1', rows)
-
-        print(f"\n✅ Google Sheet created successfully!")
-        print(f"📊 URL: {spreadsheet['spreadsheetUrl']}")
-
-        return spreadsheet
-
-    except FileNotFoundError as e:
-        print(f"\n⚠️  Google Sheets export failed: {e}")
-        print("    Results are saved to CSV file instead.")
-        return None
+        return create_and_populate(sheet_title, [SHEET_HEADERS])
+
     except Exception as e:
         print(f"\n⚠️  Google Sheets export failed: {e}")
         print("    Results are saved to CSV file instead.")
@@ -325,17 +515,36 @@ def export_to_google_sheets(results):
 
 
 if __name__ == "__main__":
+    import argparse
     import warnings
     warnings.filterwarnings('ignore')  # Suppress SSL warnings
 
-    # Scrape companies (first 15 to increase chances of getting 10 valid)
-    results = scrape_companies_concurrent(SA_COMMERCIAL_CLEANERS[:15], max_workers=5)
-
-    # Save to CSV
-    csv_file = save_to_csv(results)
+    parser = argparse.ArgumentParser(description='Scrape SA commercial cleaning companies')
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Concurrent companies (default: one per company, max 32)'
+    )
+    args = parser.parse_args()
 
-    # Try to export to Google Sheets
-    spreadsheet = export_to_google_sheets(results)
+    tmp_dir = Path('.tmp')
+    tmp_dir.mkdir(exist_ok=True)
+    csv_file = tmp_dir / 'sa_cleaning_leads.csv'
+
+    # Scrape companies (first 15 to increase chances of getting 10 valid),
+    # streaming valid leads to the CSV file and sheet as they complete
+    # (the sheet is created on the first valid lead)
+    with open(csv_file, 'w', newline='', encoding='utf-8') as f:
+        csv.writer(f).writerow(CSV_HEADERS)
+        results, spreadsheet = scrape_companies_concurrent(
+            SA_COMMERCIAL_CLEANERS[:15],
+            max_workers=args.workers,
+            csv_out=f,
+            export_sheet=True
+        )
+
+    print(f"✅ Results saved to: {csv_file}")
 
     # Summary
     print("\n" + "=" * 70)
@@ -348,8 +557,10 @@ if __name__ == "__main__":
 
     if spreadsheet:
         print(f"📊 Google Sheet: {spreadsheet['spreadsheetUrl']}")
+    elif not valid_leads:
+        print(f"📊 Google Sheet: No valid leads to export")
     else:
-        print(f"📊 Google Sheet: Not created (use CSV file)")
+        print(f"📊 Google Sheet: Not created or incomplete (use CSV file)")
 
     print("\n" + "=" * 70)
 
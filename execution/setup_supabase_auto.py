@@ -76,6 +76,7 @@ try:
     print("\n🔧 Functions created:")
     print("   - search_memories(text, integer)")
     print("   - get_memory_stats()")
+    print("   - run_connection_selftest(jsonb)")
     print("\n🔒 Security:")
     print("   - Row Level Security enabled")
     print("   - Service role policy created")
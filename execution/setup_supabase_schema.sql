@@ -56,6 +56,30 @@ BEGIN
 END;
 $$ LANGUAGE plpgsql;
 
+-- Create function for the connection self-test
+-- Inserts, reads back and deletes a row in one transaction (one RPC round trip)
+CREATE OR REPLACE FUNCTION run_connection_selftest(p_row JSONB)
+RETURNS JSONB AS $$
+DECLARE
+  inserted memories;
+BEGIN
+  INSERT INTO memories (id, created_at, category, tags, content, transcript_length, metadata)
+  SELECT r.id,
+         COALESCE(r.created_at, NOW()),
+         r.category,
+         COALESCE(r.tags, '{}'),
+         r.content,
+         COALESCE(r.transcript_length, 0),
+         COALESCE(r.metadata, '{}'::jsonb)
+  FROM jsonb_populate_record(NULL::memories, p_row) AS r
+  RETURNING * INTO inserted;
+
+  DELETE FROM memories WHERE id = inserted.id;
+
+  RETURN to_jsonb(inserted);
+END;
+$$ LANGUAGE plpgsql;
+
 -- Create view for recent memories
 CREATE OR REPLACE VIEW recent_memories AS
 SELECT id, created_at, category, tags,
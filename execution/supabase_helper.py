@@ -0,0 +1,66 @@
+"""
+Supabase helper functions.
+Builds one shared Supabase client per process so every caller reuses the
+same pooled HTTP connections instead of paying a fresh TLS handshake.
+"""
+
+import os
+from functools import lru_cache
+
+import httpx
+from dotenv import load_dotenv
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Pool shared by all PostgREST / RPC calls made through the client
+HTTP_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10)
+HTTP_TIMEOUT = 30
+
+
+@lru_cache(maxsize=1)
+def get_supabase():
+    """
+    Get the shared Supabase client, creating and warming it on first use.
+
+    Returns:
+        Supabase client
+
+    Raises:
+        ValueError: If SUPABASE_URL / SUPABASE_SERVICE_KEY are not set
+        ImportError: If the supabase package is not installed
+    """
+    from supabase import ClientOptions, create_client
+
+    load_dotenv()
+    supabase_url = os.getenv('SUPABASE_URL')
+    supabase_key = os.getenv('SUPABASE_SERVICE_KEY')
+
+    if not supabase_url or not supabase_key:
+        raise ValueError("Supabase credentials not found in .env")
+
+    http_client = httpx.Client(
+        http2=HTTP2_AVAILABLE,
+        limits=HTTP_LIMITS,
+        timeout=HTTP_TIMEOUT
+    )
+
+    try:
+        options = ClientOptions(httpx_client=http_client)
+    except TypeError:
+        # Older supabase releases can't take a custom httpx client
+        http_client.close()
+        options = None
+
+    if options is None:
+        client = create_client(supabase_url, supabase_key)
+    else:
+        client = create_client(supabase_url, supabase_key, options=options)
+
+    # Warm the pool with a cheap query so the first real call skips the handshake
+    client.table('memories').select('id', count='exact').limit(0).execute()
+
+    return client
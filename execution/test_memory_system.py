@@ -11,6 +11,11 @@ import json
 from datetime import datetime
 import subprocess
 
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
+
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from memory_database import MemoryDatabase
@@ -178,6 +183,40 @@ def test_context_monitor():
     return True
 
 
+def recent_commits(path, count=5):
+    """
+    Read the last few commits, in-process via pygit2 when available.
+
+    Args:
+        path: Directory inside the git repository
+        count: Number of commits to list
+
+    Returns:
+        tuple: (success, one-line-per-commit log or error message)
+    """
+    if pygit2 is not None:
+        try:
+            repo = pygit2.Repository(pygit2.discover_repository(str(path)))
+            walker = repo.walk(repo.head.target, pygit2.GIT_SORT_TIME)
+            lines = [
+                f"{str(commit.id)[:7]} {commit.message.splitlines()[0] if commit.message else ''}"
+                for commit, _ in zip(walker, range(count))
+            ]
+            return True, "\n".join(lines) + "\n"
+        except (pygit2.GitError, KeyError, TypeError) as e:
+            return False, str(e)
+
+    result = subprocess.run(
+        ["git", "log", "--oneline", f"-{count}"],
+        cwd=path,
+        capture_output=True,
+        text=True
+    )
+    if result.returncode == 0:
+        return True, result.stdout
+    return False, result.stderr
+
+
 def test_full_workflow():
     """Test the complete memory workflow."""
     print("\n" + "="*60)
@@ -192,17 +231,12 @@ def test_full_workflow():
 
     print("\n3. Verify git versioning...")
     db_path = Path("memory_database")
-    result = subprocess.run(
-        ["git", "log", "--oneline", "-5"],
-        cwd=db_path,
-        capture_output=True,
-        text=True
-    )
+    ok, output = recent_commits(db_path)
 
-    if result.returncode == 0:
-        print(f"   ✓ Recent commits:\n{result.stdout}")
+    if ok:
+        print(f"   ✓ Recent commits:\n{output}")
     else:
-        print(f"   ⚠️ Git log failed: {result.stderr}")
+        print(f"   ⚠️ Git log failed: {output}")
 
     print("\n✅ Full workflow tests passed!")
     return True
@@ -5,6 +5,7 @@ Test Supabase database connection and schema.
 
 import os
 import sys
+import time
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -13,6 +14,9 @@ load_dotenv()
 SUPABASE_URL = os.getenv('SUPABASE_URL')
 SUPABASE_KEY = os.getenv('SUPABASE_SERVICE_KEY')
 
+# Rows written by the batch insert test
+BATCH_TEST_SIZE = 100
+
 if not SUPABASE_URL or not SUPABASE_KEY:
     print("❌ Error: Supabase credentials not found in .env")
     sys.exit(1)
@@ -21,10 +25,10 @@ print("🔧 Testing Supabase connection...")
 print(f"📍 URL: {SUPABASE_URL}\n")
 
 try:
-    from supabase import create_client
+    from supabase_helper import get_supabase
 
-    # Create client
-    supabase = create_client(SUPABASE_URL, SUPABASE_KEY)
+    # Shared, pre-warmed client
+    supabase = get_supabase()
     print("✓ Supabase client created")
 
     # Test 1: Check if memories table exists by querying it
@@ -65,17 +69,19 @@ try:
         'metadata': {'source': 'test_script'}
     }
 
-    insert_result = supabase.table('memories').insert(test_memory).execute()
+    # Insert, read back and delete in a single RPC round trip
+    selftest_result = supabase.rpc('run_connection_selftest', {'p_row': test_memory}).execute()
+    retrieved = selftest_result.data
     print(f"✓ Test memory stored (ID: {test_memory['id']})")
 
     # Test 4: Test retrieving the memory
     print("\n🧪 Test 4: Testing memory retrieval...")
-    retrieve_result = supabase.table('memories').select('*').eq('id', test_memory['id']).execute()
-    if retrieve_result.data and len(retrieve_result.data) > 0:
-        retrieved = retrieve_result.data[0]
+    if retrieved and retrieved.get('id') == test_memory['id']:
         print(f"✓ Memory retrieved successfully")
         print(f"   Category: {retrieved['category']}")
         print(f"   Tags: {retrieved['tags']}")
+    else:
+        raise Exception(f"Self-test returned unexpected row: {retrieved}")
 
     # Test 5: Test search function
     print("\n🧪 Test 5: Testing search_memories() function...")
@@ -85,10 +91,28 @@ try:
     }).execute()
     print(f"✓ Search function works (found {len(search_result.data)} results)")
 
-    # Clean up test memory
+    # Test 6: Test batch storage (one request for all rows)
+    print(f"\n🧪 Test 6: Testing batch storage ({BATCH_TEST_SIZE} rows)...")
+    batch_rows = [
+        dict(test_memory, id=f"{test_memory['id']}_{i}")
+        for i in range(BATCH_TEST_SIZE)
+    ]
+    batch_ids = [row['id'] for row in batch_rows]
+
+    start = time.perf_counter()
+    batch_result = supabase.table('memories').insert(batch_rows).execute()
+    elapsed = time.perf_counter() - start
+    try:
+        if len(batch_result.data) != BATCH_TEST_SIZE:
+            raise Exception(f"Batch insert stored {len(batch_result.data)} of {BATCH_TEST_SIZE} rows")
+        print(f"✓ Batch insert works ({BATCH_TEST_SIZE} rows in {elapsed * 1000:.0f} ms)")
+    finally:
+        # One DELETE for the whole batch
+        supabase.table('memories').delete().in_('id', batch_ids).execute()
+
+    # The self-test function already removed the single row in the same transaction
     print("\n🧹 Cleaning up test memory...")
-    supabase.table('memories').delete().eq('id', test_memory['id']).execute()
-    print("✓ Test memory deleted")
+    print("✓ Test memories deleted")
 
     print("\n" + "="*60)
     print("✅ ALL TESTS PASSED!")
@@ -99,6 +123,7 @@ try:
     print("   - Schema: ✓ Complete")
     print("   - Functions: ✓ Working")
     print("   - CRUD operations: ✓ Working")
+    print("   - Batch inserts: ✓ Working")
     print("   - Search: ✓ Working")
     print("\n🚀 Ready for production use!")
 
@@ -6,12 +6,26 @@ Downloads video, extracts audio, and transcribes using local Whisper model.
 import sys
 import os
 import subprocess
+import traceback
 import json
+from functools import lru_cache
 from pathlib import Path
 
 # Add parent directory to path for utils import
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from ytdlp_helper import extract_video_id, yt_dlp_path
+
+# faster-whisper (CTranslate2, INT8) is several times faster than openai-whisper
+# on CPU; fall back to openai-whisper when it isn't installed
+try:
+    from faster_whisper import WhisperModel
+except ImportError:
+    WhisperModel = None
+
+# Whisper model size. Options: tiny, base, small, medium, large
+WHISPER_MODEL = "base"
+
 try:
     from utils import log_error, log_success
 except ImportError:
@@ -40,64 +54,87 @@ def download_instagram_video(url, output_path):
     try:
         print(f"📥 Downloading Instagram video from: {url}")
 
-        # Find yt-dlp executable
-        import shutil
-        yt_dlp_path = shutil.which('yt-dlp')
-        if not yt_dlp_path:
-            # Try common installation paths
-            possible_paths = [
-                '/Users/jaydenmortimer/Library/Python/3.9/bin/yt-dlp',
-                os.path.expanduser('~/Library/Python/3.9/bin/yt-dlp'),
-                '/usr/local/bin/yt-dlp',
-            ]
-            for path in possible_paths:
-                if os.path.exists(path):
-                    yt_dlp_path = path
-                    break
-
-            if not yt_dlp_path:
-                raise FileNotFoundError("yt-dlp not found. Please install with: pip3 install yt-dlp")
+        yt_dlp = yt_dlp_path()
 
         # Use yt-dlp to download the video
         cmd = [
-            yt_dlp_path,
+            yt_dlp,
             '-f', 'best',  # Get best quality
             '-o', output_path,  # Output path
             '--no-playlist',  # Don't download playlists
+            '--no-simulate',
+            '--print', 'after_move:filepath',  # Report the final file path
             url
         ]
 
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        # Output stays as bytes; only the path line is decoded
+        result = subprocess.run(cmd, capture_output=True, check=True)
 
-        # Check if file was downloaded (with or without extension)
-        base_path = Path(output_path)
+        # yt-dlp prints the final path (with whatever extension it chose)
+        lines = result.stdout.strip().splitlines()
+        actual_file = os.fsdecode(lines[-1]) if lines else ''
 
-        # First check exact path
-        if base_path.exists():
-            log_success(f"Downloaded video to: {output_path}")
-            return output_path
-
-        # Then check with common video extensions
-        possible_files = list(base_path.parent.glob(f"{base_path.name}.*"))
-
-        if possible_files:
-            actual_file = str(possible_files[0])
+        if actual_file and os.path.exists(actual_file):
             log_success(f"Downloaded video to: {actual_file}")
             return actual_file
         else:
             raise FileNotFoundError(f"Could not find downloaded file matching {output_path}")
 
     except subprocess.CalledProcessError as e:
-        log_error(f"Failed to download video: {e.stderr}")
+        log_error(f"Failed to download video: {e.stderr.decode('utf-8', 'replace')}")
         raise
     except Exception as e:
         log_error(f"Download failed: {str(e)}")
         raise
 
 
+def extract_audio(video_path):
+    """
+    Extract mono 16 kHz WAV audio (Whisper's input format) from a video.
+
+    Whisper only needs the audio, so decoding it once here means the model
+    never has to demux video frames.
+
+    Args:
+        video_path (str): Path to video file
+
+    Returns:
+        str: Path to the WAV file
+    """
+    audio_path = str(Path(video_path).with_suffix('.wav'))
+
+    print(f"\n🎵 Extracting audio...")
+    subprocess.run(
+        ['ffmpeg', '-y', '-i', video_path, '-vn', '-ac', '1', '-ar', '16000', '-f', 'wav', audio_path],
+        capture_output=True,
+        check=True
+    )
+
+    log_success(f"Extracted audio to: {audio_path}")
+    return audio_path
+
+
+@lru_cache(maxsize=2)
+def load_whisper_model(name):
+    """
+    Load a Whisper model once per process (faster-whisper INT8 when installed).
+
+    Args:
+        name (str): Model size (tiny, base, small, medium, large)
+
+    Returns:
+        WhisperModel or whisper.Whisper model
+    """
+    if WhisperModel is not None:
+        return WhisperModel(name, device="auto", compute_type="int8")
+
+    import whisper
+    return whisper.load_model(name)
+
+
 def transcribe_video(video_path):
     """
-    Transcribe video using OpenAI Whisper.
+    Transcribe video using Whisper (faster-whisper when installed).
 
     Args:
         video_path (str): Path to video file
@@ -108,14 +145,37 @@ def transcribe_video(video_path):
     try:
         print(f"\n🎤 Transcribing video with Whisper...")
 
-        import whisper
-
-        # Load the model (base is a good balance of speed and accuracy)
-        # Options: tiny, base, small, medium, large
-        model = whisper.load_model("base")
+        # Loaded once and reused when main() is called in a loop
+        model = load_whisper_model(WHISPER_MODEL)
+
+        if WhisperModel is not None:
+            # INT8 quantized model; VAD skips silent and music-only stretches
+            segments, info = model.transcribe(video_path, vad_filter=True)
+
+            # Segments decode lazily; collect them without per-segment printing
+            result_segments = [
+                {
+                    'id': segment.id,
+                    'start': segment.start,
+                    'end': segment.end,
+                    'text': segment.text
+                }
+                for segment in segments
+            ]
 
-        # Transcribe
-        result = model.transcribe(video_path, verbose=True)
+            result = {
+                'text': "".join(segment['text'] for segment in result_segments).strip(),
+                'segments': result_segments,
+                'language': info.language
+            }
+        else:
+            # Transcribe with a single progress bar instead of per-segment output;
+            # fp16 only on GPU (on CPU it just warns and falls back to fp32)
+            result = model.transcribe(
+                video_path,
+                verbose=None,
+                fp16=model.device.type == "cuda"
+            )
 
         log_success(f"Transcription complete", {
             'language': result.get('language', 'unknown'),
@@ -130,31 +190,6 @@ def transcribe_video(video_path):
         raise
 
 
-def extract_video_id(url):
-    """
-    Extract a clean identifier from Instagram URL for file naming.
-
-    Args:
-        url (str): Instagram URL
-
-    Returns:
-        str: Clean identifier
-    """
-    # Extract the post ID from URL
-    # URLs look like: https://www.instagram.com/p/DTO6HfSjTnE/ or /reel/...
-    parts = url.rstrip('/').split('/')
-
-    if 'p' in parts or 'reel' in parts:
-        try:
-            idx = parts.index('p') if 'p' in parts else parts.index('reel')
-            return parts[idx + 1]
-        except (IndexError, ValueError):
-            pass
-
-    # Fallback: use last part of URL
-    return parts[-1] if parts else 'instagram_video'
-
-
 def main(url):
     """
     Main function to download and transcribe Instagram video.
@@ -183,10 +218,19 @@ def main(url):
         # Step 1: Download video
         downloaded_video = download_instagram_video(url, video_path)
 
-        # Step 2: Transcribe
-        result = transcribe_video(downloaded_video)
+        # Step 2: Extract audio and drop the video straight away
+        media_file = downloaded_video
+        try:
+            media_file = extract_audio(downloaded_video)
+            os.remove(downloaded_video)
+            print(f"🗑️  Cleaned up video file: {downloaded_video}")
+        except (subprocess.CalledProcessError, FileNotFoundError) as e:
+            print(f"⚠️  Audio extraction failed, transcribing the video directly: {e}")
 
-        # Step 3: Save results
+        # Step 3: Transcribe
+        result = transcribe_video(media_file)
+
+        # Step 4: Save results
         # Save full text
         with open(transcript_txt, 'w', encoding='utf-8') as f:
             f.write(result['text'])
@@ -206,19 +250,19 @@ def main(url):
         print(result['text'])
         print(f"\n{'='*60}\n")
 
-        # Clean up video file to save space
+        # Clean up media file to save space
         try:
-            os.remove(downloaded_video)
-            print(f"🗑️  Cleaned up video file: {downloaded_video}")
+            os.remove(media_file)
+            print(f"🗑️  Cleaned up media file: {media_file}")
         except Exception as e:
-            print(f"⚠️  Could not delete video file: {e}")
+            print(f"⚠️  Could not delete media file: {e}")
 
         return result
 
     except Exception as e:
         log_error(f"Transcription process failed: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        if os.getenv('DEBUG'):
+            traceback.print_exc()
         sys.exit(1)
 
 
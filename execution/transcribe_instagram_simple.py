@@ -6,12 +6,16 @@ Falls back to downloading video and providing instructions for manual transcript
 import sys
 import os
 import subprocess
+import traceback
+import re
 import json
 from pathlib import Path
 
 # Add parent directory to path for utils import
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from ytdlp_helper import YoutubeDL, extract_video_id, yt_dlp_path
+
 try:
     from utils import log_error, log_success
 except ImportError:
@@ -26,6 +30,10 @@ except ImportError:
             print(f"  Details: {details}")
 
 
+# SRT cue numbers and "00:00:01,000 --> 00:00:02,000" timing lines
+SRT_META_RE = re.compile(r'^[ \t]*(?:\d+|.*-->.*)[ \t]*\r?$', re.M)
+
+
 def download_with_subtitles(url, output_path):
     """
     Try to download Instagram video with auto-generated subtitles.
@@ -40,41 +48,38 @@ def download_with_subtitles(url, output_path):
     try:
         print(f"📥 Attempting to download with auto-generated subtitles...")
 
-        # Find yt-dlp executable
-        import shutil
-        yt_dlp_path = shutil.which('yt-dlp')
-        if not yt_dlp_path:
-            possible_paths = [
-                '/Users/jaydenmortimer/Library/Python/3.9/bin/yt-dlp',
-                os.path.expanduser('~/Library/Python/3.9/bin/yt-dlp'),
-                '/usr/local/bin/yt-dlp',
+        if YoutubeDL is not None:
+            # Same options as the command line below, run in-process
+            options = {
+                'writeautomaticsub': True,
+                'subtitleslangs': ['en'],
+                'skip_download': True,  # Only get subtitles
+                'outtmpl': output_path,
+                'postprocessors': [{'key': 'FFmpegSubtitlesConvertor', 'format': 'srt', 'when': 'before_dl'}],
+                'quiet': True,
+                'no_warnings': True
+            }
+            with YoutubeDL(options) as ydl:
+                returncode = ydl.download([url])
+        else:
+            # Try to download with subtitles
+            cmd = [
+                yt_dlp_path(),
+                '--write-auto-subs',
+                '--sub-lang', 'en',
+                '--convert-subs', 'srt',
+                '--skip-download',  # Only get subtitles
+                '-o', output_path,
+                url
             ]
-            for path in possible_paths:
-                if os.path.exists(path):
-                    yt_dlp_path = path
-                    break
-
-            if not yt_dlp_path:
-                raise FileNotFoundError("yt-dlp not found")
-
-        # Try to download with subtitles
-        cmd = [
-            yt_dlp_path,
-            '--write-auto-subs',
-            '--sub-lang', 'en',
-            '--convert-subs', 'srt',
-            '--skip-download',  # Only get subtitles
-            '-o', output_path,
-            url
-        ]
-
-        result = subprocess.run(cmd, capture_output=True, text=True)
+
+            returncode = subprocess.run(cmd, capture_output=True).returncode
 
         # Check if subtitle file was created
         base_path = Path(output_path)
         subtitle_files = list(base_path.parent.glob(f"{base_path.stem}*.srt"))
 
-        if subtitle_files and result.returncode == 0:
+        if subtitle_files and returncode == 0:
             log_success("Downloaded auto-generated subtitles")
             return None, str(subtitle_files[0])
         else:
@@ -100,15 +105,8 @@ def parse_subtitles(subtitle_file):
         with open(subtitle_file, 'r', encoding='utf-8') as f:
             content = f.read()
 
-        # Simple SRT parsing - extract lines that don't contain timestamps or numbers
-        lines = []
-        for line in content.split('\n'):
-            line = line.strip()
-            # Skip empty lines, numbers, and timestamp lines
-            if line and not line.isdigit() and '-->' not in line:
-                lines.append(line)
-
-        return ' '.join(lines)
+        # Drop cue numbers and timestamp lines, then join the remaining text
+        return ' '.join(SRT_META_RE.sub('', content).split())
 
     except Exception as e:
         log_error(f"Failed to parse subtitles: {e}")
@@ -126,27 +124,21 @@ def download_video_info(url):
         dict: Video information
     """
     try:
-        import shutil
-        yt_dlp_path = shutil.which('yt-dlp')
-        if not yt_dlp_path:
-            possible_paths = [
-                '/Users/jaydenmortimer/Library/Python/3.9/bin/yt-dlp',
-                os.path.expanduser('~/Library/Python/3.9/bin/yt-dlp'),
+        if YoutubeDL is not None:
+            options = {'quiet': True, 'skip_download': True, 'no_warnings': True, 'noplaylist': True}
+            with YoutubeDL(options) as ydl:
+                info = ydl.sanitize_info(ydl.extract_info(url, download=False))
+        else:
+            cmd = [
+                yt_dlp_path(),
+                '--dump-json',
+                '--no-playlist',
+                url
             ]
-            for path in possible_paths:
-                if os.path.exists(path):
-                    yt_dlp_path = path
-                    break
-
-        cmd = [
-            yt_dlp_path,
-            '--dump-json',
-            '--no-playlist',
-            url
-        ]
 
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        info = json.loads(result.stdout)
+            # json.loads reads the UTF-8 bytes directly, no separate decode pass
+            result = subprocess.run(cmd, capture_output=True, check=True)
+            info = json.loads(result.stdout)
 
         return info
 
@@ -155,18 +147,6 @@ def download_video_info(url):
         return None
 
 
-def extract_video_id(url):
-    """Extract ID from Instagram URL."""
-    parts = url.rstrip('/').split('/')
-    if 'p' in parts or 'reel' in parts:
-        try:
-            idx = parts.index('p') if 'p' in parts else parts.index('reel')
-            return parts[idx + 1]
-        except (IndexError, ValueError):
-            pass
-    return parts[-1] if parts else 'instagram_video'
-
-
 def main(url):
     """
     Main function - attempt to get transcript via multiple methods.
@@ -256,8 +236,8 @@ def main(url):
 
     except Exception as e:
         log_error(f"Process failed: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        if os.getenv('DEBUG'):
+            traceback.print_exc()
         sys.exit(1)
 
 
@@ -5,8 +5,15 @@ Requires ASSEMBLY_AI_API_KEY in .env file.
 
 import sys
 import os
+import json
 import time
+import threading
+import subprocess
+import tempfile
+import traceback
 import requests
+from requests.adapters import HTTPAdapter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -15,6 +22,8 @@ load_dotenv()
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from ytdlp_helper import extract_video_id, yt_dlp_path
+
 try:
     from utils import log_error, log_success
 except ImportError:
@@ -25,15 +34,37 @@ except ImportError:
         print(f"✓ {msg}")
 
 
-def upload_file_to_assemblyai(file_path, api_key):
-    """Upload video file to AssemblyAI."""
-    print("📤 Uploading file to AssemblyAI...")
+# Public URL AssemblyAI POSTs to when a transcript finishes (e.g. an ngrok
+# tunnel); it must forward to ASSEMBLYAI_WEBHOOK_PORT on this machine
+WEBHOOK_URL = os.getenv("ASSEMBLYAI_WEBHOOK_URL")
+WEBHOOK_PORT = int(os.getenv("ASSEMBLYAI_WEBHOOK_PORT", "8765"))
+WEBHOOK_TIMEOUT = 30 * 60  # seconds before falling back to polling
+
+# Polling fallback: exponential backoff capped at this many seconds
+MAX_POLL_INTERVAL = 30
+
+# Upload read size; the file is streamed in chunks of this many bytes
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Shared keep-alive session: upload, start and every poll reuse one TLS connection
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
 
+def _iter_chunks(file_path, chunk_size=UPLOAD_CHUNK_SIZE):
+    """Yield a file's bytes in chunk_size pieces."""
+    with open(file_path, "rb") as fh:
+        while chunk := fh.read(chunk_size):
+            yield chunk
+
+
+def _upload(data, api_key):
+    """POST an upload body (bytes iterator) to AssemblyAI and return its upload_url."""
     url = "https://api.assemblyai.com/v2/upload"
     headers = {"authorization": api_key}
 
-    with open(file_path, "rb") as f:
-        response = requests.post(url, headers=headers, data=f)
+    # A generator body is sent chunk-encoded, holding one chunk in memory at a time
+    response = SESSION.post(url, headers=headers, data=data)
 
     if response.status_code == 200:
         upload_url = response.json()["upload_url"]
@@ -43,8 +74,57 @@ def upload_file_to_assemblyai(file_path, api_key):
         raise Exception(f"Upload failed: {response.status_code} - {response.text}")
 
 
-def start_transcription(audio_url, api_key):
-    """Start transcription job."""
+def upload_file_to_assemblyai(file_path, api_key):
+    """Upload video file to AssemblyAI, streamed in 1 MiB chunks."""
+    print("📤 Uploading file to AssemblyAI...")
+    return _upload(_iter_chunks(file_path), api_key)
+
+
+def download_and_upload(url, api_key):
+    """
+    Download a video with yt-dlp and upload it to AssemblyAI in one pipeline.
+
+    yt-dlp writes the video to stdout and each chunk is uploaded as soon as
+    it is read, so the download and upload overlap and nothing hits disk.
+
+    Args:
+        url (str): Video URL (Instagram post/reel, YouTube, ...)
+        api_key (str): AssemblyAI API key
+
+    Returns:
+        str: AssemblyAI upload_url
+    """
+    print(f"📥📤 Streaming {url} from yt-dlp to AssemblyAI...")
+
+    # stderr goes to a temp file, not a pipe: nobody reads it until the upload
+    # ends, and a full pipe would block yt-dlp (and so the upload) forever
+    with tempfile.TemporaryFile() as stderr_file:
+        process = subprocess.Popen(
+            [yt_dlp_path(), '-f', 'best', '-o', '-', '--no-playlist', '--quiet', url],
+            stdout=subprocess.PIPE,
+            stderr=stderr_file
+        )
+
+        def stdout_chunks():
+            while chunk := process.stdout.read(UPLOAD_CHUNK_SIZE):
+                yield chunk
+
+        try:
+            upload_url = _upload(stdout_chunks(), api_key)
+        finally:
+            process.stdout.close()
+            returncode = process.wait()
+            stderr_file.seek(0)
+            stderr = stderr_file.read().decode(errors='replace')
+
+    if returncode != 0:
+        raise Exception(f"yt-dlp failed ({returncode}): {stderr.strip()}")
+
+    return upload_url
+
+
+def start_transcription(audio_url, api_key, webhook_url=None):
+    """Start transcription job, optionally asking for a completion webhook."""
     print("🎤 Starting transcription...")
 
     url = "https://api.assemblyai.com/v2/transcript"
@@ -56,8 +136,10 @@ def start_transcription(audio_url, api_key):
     data = {
         "audio_url": audio_url
     }
+    if webhook_url:
+        data["webhook_url"] = webhook_url
 
-    response = requests.post(url, json=data, headers=headers)
+    response = SESSION.post(url, json=data, headers=headers)
 
     if response.status_code == 200:
         transcript_id = response.json()["id"]
@@ -67,15 +149,65 @@ def start_transcription(audio_url, api_key):
         raise Exception(f"Failed to start transcription: {response.status_code} - {response.text}")
 
 
+class WebhookListener:
+    """Local HTTP server that records transcript ids AssemblyAI reports as finished."""
+
+    def __init__(self, port):
+        self.finished = {}
+        self.event = threading.Event()
+        listener = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get("content-length", 0))
+                try:
+                    payload = json.loads(self.rfile.read(length) or b"{}")
+                except ValueError:
+                    payload = {}
+
+                transcript_id = payload.get("transcript_id")
+                if transcript_id:
+                    listener.finished[transcript_id] = payload.get("status")
+                    listener.event.set()
+
+                self.send_response(200)
+                self.end_headers()
+
+            def log_message(self, format, *args):
+                pass  # Keep the console to our own progress output
+
+        self.server = ThreadingHTTPServer(("", port), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def wait(self, transcript_id, timeout):
+        """Block until the webhook for transcript_id arrives. Returns False on timeout."""
+        deadline = time.monotonic() + timeout
+        while transcript_id not in self.finished:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self.event.wait(remaining):
+                return False
+            self.event.clear()
+        return True
+
+
 def poll_transcription(transcript_id, api_key):
-    """Poll for transcription completion."""
+    """Poll for transcription completion with exponential backoff."""
     url = f"https://api.assemblyai.com/v2/transcript/{transcript_id}"
     headers = {"authorization": api_key}
 
     print("⏳ Waiting for transcription to complete...")
 
+    attempt = 0
     while True:
-        response = requests.get(url, headers=headers)
+        response = SESSION.get(url, headers=headers)
         result = response.json()
 
         status = result["status"]
@@ -87,7 +219,34 @@ def poll_transcription(transcript_id, api_key):
             raise Exception(f"Transcription failed: {result.get('error', 'Unknown error')}")
         else:
             print(f"   Status: {status}...")
-            time.sleep(3)
+            delay = min(MAX_POLL_INTERVAL, 1.5 ** attempt)
+            retry_after = response.headers.get("retry-after")
+            if retry_after and retry_after.isdigit():
+                delay = max(delay, int(retry_after))
+            attempt += 1
+            time.sleep(delay)
+
+
+def wait_for_transcription(audio_url, api_key):
+    """
+    Start a transcription and wait for it to finish.
+
+    Uses the AssemblyAI completion webhook when ASSEMBLYAI_WEBHOOK_URL is set
+    (one final GET instead of a polling loop), otherwise polls with backoff.
+    """
+    if not WEBHOOK_URL:
+        transcript_id = start_transcription(audio_url, api_key)
+        return poll_transcription(transcript_id, api_key)
+
+    # Listen before starting the job so a fast completion isn't missed
+    with WebhookListener(WEBHOOK_PORT) as listener:
+        transcript_id = start_transcription(audio_url, api_key, WEBHOOK_URL)
+        print(f"⏳ Waiting for completion webhook on port {WEBHOOK_PORT}...")
+        if not listener.wait(transcript_id, WEBHOOK_TIMEOUT):
+            print("   ⚠️ No webhook received, falling back to polling")
+
+    # Completed jobs return on the first GET
+    return poll_transcription(transcript_id, api_key)
 
 
 def main(video_file):
@@ -95,7 +254,7 @@ def main(video_file):
     Transcribe video using AssemblyAI.
 
     Args:
-        video_file (str): Path to video file
+        video_file (str): Path to video file, or a video URL to stream via yt-dlp
     """
     try:
         # Get API key
@@ -114,30 +273,35 @@ def main(video_file):
             print("\n" + "="*60 + "\n")
             sys.exit(1)
 
-        # Check if file exists
-        if not os.path.exists(video_file):
-            raise FileNotFoundError(f"Video file not found: {video_file}")
-
         print(f"\n{'='*60}")
         print(f"CLOUD-BASED VIDEO TRANSCRIPTION")
         print(f"{'='*60}\n")
-        print(f"File: {video_file}")
-        print(f"Size: {os.path.getsize(video_file) / (1024*1024):.2f} MB\n")
 
-        # Upload file
-        audio_url = upload_file_to_assemblyai(video_file, api_key)
+        if video_file.startswith(('http://', 'https://')):
+            # URL: pipe the download straight into the upload
+            print(f"URL: {video_file}\n")
+            audio_url = download_and_upload(video_file, api_key)
+            video_path = Path('.tmp') / f"instagram_{extract_video_id(video_file)}"
+            video_path.parent.mkdir(exist_ok=True)
+        else:
+            # Check if file exists
+            if not os.path.exists(video_file):
+                raise FileNotFoundError(f"Video file not found: {video_file}")
 
-        # Start transcription
-        transcript_id = start_transcription(audio_url, api_key)
+            print(f"File: {video_file}")
+            print(f"Size: {os.path.getsize(video_file) / (1024*1024):.2f} MB\n")
+
+            # Upload file
+            audio_url = upload_file_to_assemblyai(video_file, api_key)
+            video_path = Path(video_file)
 
-        # Poll for completion
-        result = poll_transcription(transcript_id, api_key)
+        # Start transcription and wait for completion
+        result = wait_for_transcription(audio_url, api_key)
 
         # Extract transcript text
         transcript_text = result["text"]
 
         # Save to file
-        video_path = Path(video_file)
         transcript_file = video_path.parent / f"transcript_{video_path.stem}.txt"
 
         with open(transcript_file, 'w', encoding='utf-8') as f:
@@ -160,15 +324,16 @@ def main(video_file):
 
     except Exception as e:
         log_error(f"Transcription failed: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        if os.getenv('DEBUG'):
+            traceback.print_exc()
         sys.exit(1)
 
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
-        print("Usage: python transcribe_with_api.py <video_file_path>")
+        print("Usage: python transcribe_with_api.py <video_file_path | video_url>")
         print("Example: python transcribe_with_api.py .tmp/instagram_DTO6HfSjTnE")
+        print("Example: python transcribe_with_api.py https://www.instagram.com/p/DTO6HfSjTnE/")
         sys.exit(1)
 
     video_file = sys.argv[1]
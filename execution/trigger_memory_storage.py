@@ -6,6 +6,8 @@ Called when user confirms they want to save memories.
 
 import sys
 import os
+import json
+import shutil
 import subprocess
 from pathlib import Path
 from datetime import datetime
@@ -32,26 +34,28 @@ def save_current_transcript():
         '.claude/current_session.txt',
     ]
 
-    transcript_content = ""
-
     for source in possible_sources:
         source_path = Path(source)
-        if source_path.exists():
-            transcript_content = source_path.read_text()
+        if source_path.exists() and source_path.stat().st_size:
+            # Point-in-time copy: the agent reads it later while the session
+            # file keeps changing. copyfile copies in the kernel where it can
+            shutil.copyfile(source_path, transcript_path)
             break
+    else:
+        # If no transcript found, create one from environment or stdin
+        transcript_content = ""
 
-    # If no transcript found, create one from environment or stdin
-    if not transcript_content:
         # Try to read from stdin if available
         if not sys.stdin.isatty():
             transcript_content = sys.stdin.read()
-        else:
+
+        if not transcript_content:
             # Last resort: indicate transcript unavailable
             transcript_content = f"Transcript saved at {datetime.now().isoformat()}\n"
             transcript_content += "Note: Full transcript not available, using environment data.\n"
 
-    # Save transcript
-    transcript_path.write_text(transcript_content)
+        # Save transcript
+        transcript_path.write_text(transcript_content)
 
     print(f"📝 Transcript saved: {transcript_path}")
     return str(transcript_path)
@@ -79,24 +83,38 @@ def launch_memory_agent(transcript_path: str):
         sys.executable,
         str(script_path),
         transcript_path,
-        f'{metadata}'  # Will be parsed as JSON
+        json.dumps(metadata)
     ]
 
     # Run in background
-    # On Unix-like systems, use subprocess with background process
+    # posix_spawn starts the agent without fork()ing this interpreter;
+    # output goes to /dev/null since nothing reads it
     try:
-        process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            start_new_session=True  # Detach from parent
-        )
-
-        print(f"✓ Memory agent launched (PID: {process.pid})")
+        try:
+            pid = os.posix_spawn(
+                sys.executable,
+                cmd,
+                os.environ,
+                file_actions=[
+                    (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+                    (os.POSIX_SPAWN_DUP2, 1, 2)
+                ],
+                setsid=True  # Detach from parent
+            )
+        except (AttributeError, NotImplementedError, OSError):
+            # No posix_spawn (e.g. Windows): start a detached subprocess
+            pid = subprocess.Popen(
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True  # Detach from parent
+            ).pid
+
+        print(f"✓ Memory agent launched (PID: {pid})")
         print(f"  Agent will process transcript in background")
         print(f"  Check memory_database/ for stored memories")
 
-        return process.pid
+        return pid
 
     except Exception as e:
         print(f"❌ Error launching memory agent: {e}")
@@ -2,36 +2,30 @@
 Update the existing Google Sheet with corrected, verified leads.
 """
 
-import json
-from pathlib import Path
-from google.oauth2.credentials import Credentials
+from functools import lru_cache
 from googleapiclient.discovery import build
+from google_auth_helper import get_credentials
+from google_sheets_helper import execute_with_retry
 
 # Sheet ID from earlier
 SHEET_ID = '1NdwklSKZIyYIzbQizhAx0qk0tONjS_062Wj8_c6rNVI'
 
-def get_credentials():
-    """Load existing credentials."""
-    token_path = Path.home() / '.config/google-drive-mcp/tokens.json'
-
-    if token_path.exists():
-        with open(token_path, 'r') as token:
-            token_data = json.load(token)
-            creds = Credentials.from_authorized_user_info(token_data)
-            return creds
-
-    print("Error: No credentials found")
-    return None
+@lru_cache(maxsize=1)
+def get_sheets_service():
+    """Build the Sheets service once per process (None without credentials)."""
+    # Token only: this script never opens a browser for OAuth
+    creds = get_credentials(interactive=False)
+    if not creds:
+        return None
+    return build('sheets', 'v4', credentials=creds, cache_discovery=True)
 
 def update_sheet():
     """Update the sheet with corrected data."""
 
-    creds = get_credentials()
-    if not creds:
+    service = get_sheets_service()
+    if not service:
         return
 
-    service = build('sheets', 'v4', credentials=creds)
-
     # Corrected verified data
     data = [
         ["Company Name", "Website", "Email 1", "Email 2", "Cleaning Focus", "Employee Count", "Notes"],
@@ -47,27 +41,26 @@ def update_sheet():
         ["Supreme Cleaning Solutions", "https://www.supremecleaning.co.za", "info@supremecleaning.co.za", "quotes@supremecleaning.co.za", "Corporate workplace cleaning", "90+", "Johannesburg and Pretoria coverage"]
     ]
 
-    # Clear existing data first
-    service.spreadsheets().values().clear(
-        spreadsheetId=SHEET_ID,
-        range='Sheet1!A1:Z100'
-    ).execute()
-
-    print("✅ Cleared old data")
-
-    # Write new corrected data
-    body = {'values': data}
-    result = service.spreadsheets().values().update(
-        spreadsheetId=SHEET_ID,
-        range='Sheet1!A1',
-        valueInputOption='RAW',
-        body=body
-    ).execute()
-
-    print(f"✅ Updated {result.get('updatedCells')} cells with corrected data")
-
-    # Format header row (make bold, freeze)
+    # Clear A1:Z100 and write the new data, format the header row (bold)
+    # and freeze it, all in one batchUpdate call
     requests = [
+        {
+            'updateCells': {
+                'range': {
+                    'sheetId': 0,
+                    'startRowIndex': 0,
+                    'endRowIndex': 100,
+                    'startColumnIndex': 0,
+                    'endColumnIndex': 26
+                },
+                'rows': [
+                    {'values': [{'userEnteredValue': {'stringValue': value}} for value in row]}
+                    for row in data
+                ],
+                # Cells in the range that aren't in rows are cleared
+                'fields': 'userEnteredValue'
+            }
+        },
         {
             'repeatCell': {
                 'range': {
@@ -95,11 +88,13 @@ def update_sheet():
         }
     ]
 
-    service.spreadsheets().batchUpdate(
+    # updateCells / repeatCell / freeze give the same result if repeated
+    execute_with_retry(service.spreadsheets().batchUpdate(
         spreadsheetId=SHEET_ID,
         body={'requests': requests}
-    ).execute()
+    ), idempotent=True)
 
+    print(f"✅ Replaced old data with {sum(len(row) for row in data)} cells of corrected data")
     print("✅ Applied formatting")
 
     sheet_url = f"https://docs.google.com/spreadsheets/d/{SHEET_ID}/edit"
@@ -4,7 +4,7 @@ Upload SA cleaning leads to Google Sheets using gcp-oauth credentials
 
 import os
 import sys
-import json
+from functools import lru_cache
 from pathlib import Path
 
 # Add parent directory to path to import google_sheets_helper
@@ -14,84 +14,41 @@ sys.path.insert(0, str(Path(__file__).parent))
 os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = '/Volumes/MortAihq/MortaiHQ/Agentic Agents /anti grav workflows/Lead scraper : cold email sender /gcp-oauth.keys.json'
 
 try:
-    from google.oauth2.credentials import Credentials
-    from google_auth_oauthlib.flow import InstalledAppFlow
-    from google.auth.transport.requests import Request
     from googleapiclient.discovery import build
-    import pickle
+    import google_auth_oauthlib  # noqa: F401 (needed by google_auth_helper)
 except ImportError as e:
     print(f"Missing required package: {e}")
     print("Installing required packages...")
     os.system("pip3 install --user google-auth-oauthlib google-auth-httplib2 google-api-python-client")
-    from google.oauth2.credentials import Credentials
-    from google_auth_oauthlib.flow import InstalledAppFlow
-    from google.auth.transport.requests import Request
     from googleapiclient.discovery import build
-    import pickle
-
-SCOPES = ['https://www.googleapis.com/auth/spreadsheets', 'https://www.googleapis.com/auth/drive.file']
-
-def get_credentials():
-    """Get or create credentials."""
-    creds = None
-    token_path = Path.home() / '.config/google-drive-mcp/tokens.json'
-
-    # Try to load existing token
-    if token_path.exists():
-        try:
-            with open(token_path, 'r') as token:
-                token_data = json.load(token)
-                creds = Credentials.from_authorized_user_info(token_data, SCOPES)
-        except Exception as e:
-            print(f"Could not load existing token: {e}")
-
-    # If no valid credentials, authenticate
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            print("Refreshing expired credentials...")
-            creds.refresh(Request())
-        else:
-            print("Starting OAuth flow...")
-            oauth_path = Path('/Volumes/MortAihq/MortaiHQ/Agentic Agents /anti grav workflows/Lead scraper : cold email sender /gcp-oauth.keys.json')
-
-            if not oauth_path.exists():
-                print(f"Error: OAuth credentials not found at {oauth_path}")
-                return None
-
-            flow = InstalledAppFlow.from_client_secrets_file(str(oauth_path), SCOPES)
-            creds = flow.run_local_server(port=0)
-
-            # Save credentials
-            token_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(token_path, 'w') as token:
-                token.write(creds.to_json())
-            print(f"Credentials saved to {token_path}")
-
-    return creds
 
-def create_sheet_with_data():
-    """Create Google Sheet with SA cleaning leads."""
+from google_auth_helper import get_credentials
+from google_sheets_helper import CSV_UPLOAD_THRESHOLD, create_and_populate, upload_rows_via_csv
 
-    # Get credentials
+@lru_cache(maxsize=1)
+def get_sheets_service():
+    """Build the Sheets service once per process (None without credentials)."""
     creds = get_credentials()
     if not creds:
-        print("Failed to get credentials")
         return None
+    return build('sheets', 'v4', credentials=creds, cache_discovery=True)
 
-    # Build service
-    service = build('sheets', 'v4', credentials=creds)
-
-    # Create spreadsheet
-    spreadsheet = {
-        'properties': {
-            'title': 'SA Commercial Cleaning Leads - Test Scrape'
-        }
-    }
+@lru_cache(maxsize=1)
+def get_drive_service():
+    """Build the Drive service once per process (None without credentials)."""
+    creds = get_credentials()
+    if not creds:
+        return None
+    return build('drive', 'v3', credentials=creds, cache_discovery=True)
 
-    spreadsheet = service.spreadsheets().create(body=spreadsheet, fields='spreadsheetId,spreadsheetUrl').execute()
-    spreadsheet_id = spreadsheet['spreadsheetId']
+def create_sheet_with_data():
+    """Create Google Sheet with SA cleaning leads."""
 
-    print(f"✅ Created spreadsheet: {spreadsheet['spreadsheetUrl']}")
+    # Get credentials and the (cached) service
+    service = get_sheets_service()
+    if not service:
+        print("Failed to get credentials")
+        return None
 
     # Prepare data
     data = [
@@ -108,16 +65,17 @@ def create_sheet_with_data():
         ["A-Len Cleaning & Support Services", "https://www.alen.co.za", "sales@alen.co.za", "info@alen.co.za", "", "500+", "Commercial cleaning, facilities management, industrial cleaning", "Yes", "BEE Level 1 certified, major corporate clients"]
     ]
 
-    # Write data
-    body = {'values': data}
-    result = service.spreadsheets().values().update(
-        spreadsheetId=spreadsheet_id,
-        range='Sheet1!A1',
-        valueInputOption='RAW',
-        body=body
-    ).execute()
+    title = 'SA Commercial Cleaning Leads - Test Scrape'
+
+    # Large tables go up as a single CSV file converted by Drive
+    if len(data) > CSV_UPLOAD_THRESHOLD:
+        spreadsheet = upload_rows_via_csv(data, title, drive_service=get_drive_service())
+        print(f"\n📊 Google Sheet URL: {spreadsheet['spreadsheetUrl']}")
+        return spreadsheet
 
-    print(f"✅ Updated {result.get('updatedCells')} cells")
+    # Create the spreadsheet with the rows inline: one request instead of
+    # create followed by values.update
+    spreadsheet = create_and_populate(title, data, sheets_service=service)
     print(f"\n📊 Google Sheet URL: {spreadsheet['spreadsheetUrl']}")
 
     return spreadsheet
@@ -4,13 +4,28 @@ Common helpers used across multiple execution scripts.
 """
 
 import os
+import re
+import sys
 import json
+import mmap
 from pathlib import Path
 from dotenv import load_dotenv
 
+# orjson is much faster for large lead lists; fall back to stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Load environment variables
 load_dotenv()
 
+# Files at least this large are parsed straight from a read-only mmap
+MMAP_THRESHOLD = 1 << 20
+
+# One "@", something before it and a "." somewhere after it
+EMAIL_RE = re.compile(r'[^@]+@[^@]*\.[^@]*')
+
 
 def get_env_variable(var_name, required=True):
     """
@@ -59,8 +74,11 @@ def save_json(data, filename):
     tmp_dir = ensure_tmp_dir()
     filepath = tmp_dir / filename
 
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        filepath.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
 
     print(f"✓ Saved data to {filepath}")
     return filepath
@@ -84,8 +102,16 @@ def load_json(filename):
     if not filepath.exists():
         raise FileNotFoundError(f"File {filepath} not found")
 
-    with open(filepath, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    if orjson is not None and filepath.stat().st_size >= MMAP_THRESHOLD:
+        # Parse the mapped pages directly instead of copying the file into memory first
+        with open(filepath, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                data = orjson.loads(view)
+    elif orjson is not None:
+        data = orjson.loads(filepath.read_bytes())
+    else:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            data = json.load(f)
 
     print(f"✓ Loaded data from {filepath}")
     return data
@@ -99,9 +125,11 @@ def log_error(error_msg, context=None):
         error_msg (str): Error message
         context (dict): Optional context information
     """
-    print(f"✗ ERROR: {error_msg}")
+    # Assembled first so the message and its context go out in one write
+    msg = f"✗ ERROR: {error_msg}\n"
     if context:
-        print(f"  Context: {json.dumps(context, indent=2)}")
+        msg += f"  Context: {json.dumps(context, indent=2)}\n"
+    sys.stdout.write(msg)
 
 
 def log_success(success_msg, details=None):
@@ -112,9 +140,10 @@ def log_success(success_msg, details=None):
         success_msg (str): Success message
         details (dict): Optional details
     """
-    print(f"✓ SUCCESS: {success_msg}")
+    msg = f"✓ SUCCESS: {success_msg}\n"
     if details:
-        print(f"  Details: {json.dumps(details, indent=2)}")
+        msg += f"  Details: {json.dumps(details, indent=2)}\n"
+    sys.stdout.write(msg)
 
 
 def validate_email(email):
@@ -127,15 +156,4 @@ def validate_email(email):
     Returns:
         bool: True if email appears valid, False otherwise
     """
-    if not email or '@' not in email:
-        return False
-
-    parts = email.split('@')
-    if len(parts) != 2:
-        return False
-
-    local, domain = parts
-    if not local or not domain or '.' not in domain:
-        return False
-
-    return True
+    return bool(email) and EMAIL_RE.fullmatch(email) is not None
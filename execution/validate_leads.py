@@ -5,6 +5,7 @@ Removes duplicates, validates emails, and enriches data.
 
 import sys
 from utils import (
+    EMAIL_RE,
     load_json,
     save_json,
     validate_email,
@@ -12,13 +13,44 @@ from utils import (
     log_success
 )
 
+# Bloom filter for bounded-memory dedup of very large batches (optional)
+try:
+    from pybloom_live import ScalableBloomFilter
+except ImportError:
+    ScalableBloomFilter = None
+
+# pandas for vectorized validation of large batches (optional)
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+# Fields every lead must have
+REQUIRED_FIELDS = ('first_name', 'email', 'company_name')
+
+# Batches this large are validated column-wise with pandas
+VECTORIZE_MIN_LEADS = 1000
+
 
 class LeadValidator:
     """Validate and clean lead data."""
 
-    def __init__(self):
-        """Initialize validator."""
-        self.seen_emails = set()
+    def __init__(self, approximate_dedup=False):
+        """
+        Initialize validator.
+
+        Args:
+            approximate_dedup (bool): Track seen emails in a scalable Bloom filter
+                instead of a set. Memory stays a few bits per email, at the cost
+                of ~0.1% of unique emails being reported as duplicates.
+                Requires pybloom-live.
+        """
+        if approximate_dedup:
+            if ScalableBloomFilter is None:
+                raise ImportError("approximate_dedup requires pybloom-live (pip install pybloom-live)")
+            self.seen_emails = ScalableBloomFilter(initial_capacity=100_000, error_rate=0.001)
+        else:
+            self.seen_emails = set()
         self.stats = {
             'total': 0,
             'valid': 0,
@@ -27,24 +59,25 @@ class LeadValidator:
             'missing_required': 0
         }
 
-    def is_valid_lead(self, lead):
+    def is_valid_lead(self, lead, email=None):
         """
         Check if a lead has all required fields and valid email.
 
         Args:
             lead (dict): Lead data
+            email (str): Normalized (stripped, lowercased) email, if already computed
 
         Returns:
             tuple: (is_valid, reason)
         """
         # Check required fields
-        required_fields = ['first_name', 'email', 'company_name']
-        for field in required_fields:
+        for field in REQUIRED_FIELDS:
             if not lead.get(field):
                 return False, f"Missing required field: {field}"
 
         # Validate email
-        email = lead.get('email', '').strip().lower()
+        if email is None:
+            email = lead.get('email', '').strip().lower()
         if not validate_email(email):
             return False, "Invalid email format"
 
@@ -54,12 +87,13 @@ class LeadValidator:
 
         return True, "Valid"
 
-    def clean_lead(self, lead):
+    def clean_lead(self, lead, email=None):
         """
         Clean and normalize lead data.
 
         Args:
             lead (dict): Raw lead data
+            email (str): Normalized (stripped, lowercased) email, if already computed
 
         Returns:
             dict: Cleaned lead data
@@ -69,7 +103,7 @@ class LeadValidator:
         # Clean and normalize each field
         cleaned['first_name'] = lead.get('first_name', '').strip()
         cleaned['last_name'] = lead.get('last_name', '').strip()
-        cleaned['email'] = lead.get('email', '').strip().lower()
+        cleaned['email'] = email if email is not None else lead.get('email', '').strip().lower()
         cleaned['title'] = lead.get('title', '').strip()
         cleaned['linkedin_url'] = lead.get('linkedin_url', '').strip()
         cleaned['company_name'] = lead.get('company_name', '').strip()
@@ -85,45 +119,121 @@ class LeadValidator:
 
         return cleaned
 
+    def _count_invalid(self, reason):
+        """Update stats for a lead rejected with the given reason."""
+        reason_lower = reason.lower()
+        if 'email' in reason_lower:
+            self.stats['invalid_email'] += 1
+        elif 'duplicate' in reason_lower:
+            self.stats['duplicate'] += 1
+        else:
+            self.stats['missing_required'] += 1
+
+    def _validate_leads_vectorized(self, leads):
+        """
+        Validate a large batch with pandas column operations.
+
+        Gives the same results as the per-lead loop: checks run in the same
+        order (required fields, email format, duplicates) and only leads that
+        pass the first two checks take part in duplicate detection.
+
+        Args:
+            leads (list): List of lead dictionaries
+
+        Returns:
+            dict: Validation results with valid and invalid leads
+        """
+        df = pd.DataFrame(leads, columns=list(REQUIRED_FIELDS))
+        emails = df['email'].fillna('').astype(str).str.strip().str.lower()
+
+        # One boolean mask per check
+        missing = {field: ~df[field].fillna('').astype(bool) for field in REQUIRED_FIELDS}
+        has_required = ~(missing['first_name'] | missing['email'] | missing['company_name'])
+        email_ok = has_required & emails.str.fullmatch(EMAIL_RE).fillna(False)
+        duplicate = email_ok & (emails.isin(self.seen_emails) | (emails.where(email_ok).duplicated() & email_ok))
+        valid_mask = email_ok & ~duplicate
+
+        valid_leads = []
+        invalid_leads = []
+        clean_lead = self.clean_lead
+        email_list = emails.tolist()
+
+        for i, is_valid in enumerate(valid_mask.tolist()):
+            lead = leads[i]
+            if is_valid:
+                valid_leads.append(clean_lead(lead, email_list[i]))
+                continue
+
+            if not has_required.iat[i]:
+                field = next(f for f in REQUIRED_FIELDS if missing[f].iat[i])
+                reason = f"Missing required field: {field}"
+            elif not email_ok.iat[i]:
+                reason = "Invalid email format"
+            else:
+                reason = "Duplicate email"
+            lead['invalid_reason'] = reason
+            invalid_leads.append(lead)
+            self._count_invalid(reason)
+
+        self.seen_emails.update(emails[valid_mask])
+        self.stats['valid'] += len(valid_leads)
+
+        return {
+            'valid': valid_leads,
+            'invalid': invalid_leads,
+            'stats': self.stats
+        }
+
     def validate_leads(self, leads):
         """
         Validate a list of leads.
 
+        Batches of VECTORIZE_MIN_LEADS or more are validated with pandas when
+        it is installed and exact (set-based) dedup is in use.
+
         Args:
             leads (list): List of lead dictionaries
 
         Returns:
             dict: Validation results with valid and invalid leads
         """
+        self.stats['total'] = len(leads)
+
+        if pd is not None and len(leads) >= VECTORIZE_MIN_LEADS and isinstance(self.seen_emails, set):
+            return self._validate_leads_vectorized(leads)
+
         valid_leads = []
         invalid_leads = []
 
-        self.stats['total'] = len(leads)
+        # Bound once outside the loop
+        stats = self.stats
+        seen_add = self.seen_emails.add
+        valid_append = valid_leads.append
+        invalid_append = invalid_leads.append
+        is_valid_lead = self.is_valid_lead
+        clean_lead = self.clean_lead
+        count_invalid = self._count_invalid
 
         for lead in leads:
-            is_valid, reason = self.is_valid_lead(lead)
+            # Normalized once, shared by validation and cleaning
+            email = (lead.get('email') or '').strip().lower()
+            is_valid, reason = is_valid_lead(lead, email)
 
             if is_valid:
                 # Clean the lead
-                cleaned_lead = self.clean_lead(lead)
-                valid_leads.append(cleaned_lead)
+                valid_append(clean_lead(lead, email))
 
                 # Mark email as seen
-                self.seen_emails.add(cleaned_lead['email'])
-                self.stats['valid'] += 1
+                seen_add(email)
+                stats['valid'] += 1
 
             else:
                 # Track why it was invalid
                 lead['invalid_reason'] = reason
-                invalid_leads.append(lead)
+                invalid_append(lead)
 
                 # Update stats
-                if 'email' in reason.lower():
-                    self.stats['invalid_email'] += 1
-                elif 'duplicate' in reason.lower():
-                    self.stats['duplicate'] += 1
-                else:
-                    self.stats['missing_required'] += 1
+                count_invalid(reason)
 
         return {
             'valid': valid_leads,
@@ -132,13 +242,14 @@ class LeadValidator:
         }
 
 
-def main(input_file='leads_raw.json', output_file='leads_validated.json'):
+def main(input_file='leads_raw.json', output_file='leads_validated.json', approximate_dedup=False):
     """
     Validate leads from input file and save to output file.
 
     Args:
         input_file (str): Input JSON file in .tmp/
         output_file (str): Output JSON file in .tmp/
+        approximate_dedup (bool): Use Bloom-filter dedup (for millions of leads)
     """
     try:
         # Load raw leads
@@ -146,7 +257,7 @@ def main(input_file='leads_raw.json', output_file='leads_validated.json'):
         print(f"Loaded {len(leads)} leads from {input_file}")
 
         # Validate
-        validator = LeadValidator()
+        validator = LeadValidator(approximate_dedup=approximate_dedup)
         results = validator.validate_leads(leads)
 
         # Save valid leads
@@ -6,11 +6,15 @@ Verify and fix SA cleaning company leads.
 - Find correct contact emails
 """
 
+import atexit
 import requests
 import re
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
-import time
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
+from urllib.parse import urljoin, urlparse
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from keyword_helper import KeywordMatcher
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -18,45 +22,148 @@ HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
 }
 
+# One pooled session: the sub-pages of a company share a host, so keep-alive
+# saves a TCP + TLS handshake on every request after the first
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+_adapter = HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=20,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504], raise_on_status=False)
+)
+SESSION.mount('http://', _adapter)
+SESSION.mount('https://', _adapter)
+atexit.register(SESSION.close)
+
+# Companies checked at once, and sub-pages fetched at once per company
+COMPANY_WORKERS = 10
+PAGE_WORKERS = 4
+
+# Enough of a page for its first 3000 chars of visible text
+MAX_BODY_BYTES = 256 * 1024
+
+# Only the <body> is parsed; these tags are dropped before reading text
+BODY_ONLY = SoupStrainer('body')
+DECOMPOSE_TAGS = frozenset({'script', 'style', 'nav', 'footer'})
+
+# Hosts that refused or timed out while connecting; their remaining
+# sub-pages are skipped (a slow page alone doesn't mark a host dead)
+DEAD_HOSTS = set()
+
+def _keyword_re(keywords):
+    """Compile keywords into one alternation (matches if any is a substring)."""
+    return re.compile('|'.join(map(re.escape, keywords)))
+
+EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+
+# Role inboxes, used only when no personal address is found
+GENERIC_EMAIL_RE = _keyword_re(['info@', 'hello@', 'contact@', 'support@', 'admin@', 'enquiries@', 'reception@'])
+
+# Focus labels in priority order, first match wins
+FOCUS_LABELS = [
+    "Office cleaning specialist",
+    "Industrial cleaning services",
+    "Restaurant cleaning services",
+    "Medical facility cleaning",
+    "Carpet and floor cleaning",
+    "Window cleaning specialist",
+    "Retail space cleaning",
+]
+
+# Every page-text signal, found in one pass over the lowercased text
+PAGE_MATCHER = KeywordMatcher({
+    "Office cleaning specialist": ['office cleaning', 'corporate cleaning', 'workplace'],
+    "Industrial cleaning services": ['industrial', 'factory', 'warehouse'],
+    "Restaurant cleaning services": ['restaurant', 'food', 'kitchen'],
+    "Medical facility cleaning": ['medical', 'healthcare', 'hospital', 'clinic'],
+    "Carpet and floor cleaning": ['carpet', 'floor', 'upholstery'],
+    "Window cleaning specialist": ['window', 'glass', 'facade'],
+    "Retail space cleaning": ['retail', 'shop', 'store'],
+    'is_cleaning': [
+        'cleaning service', 'cleaning company', 'cleaner', 'janitorial',
+        'office cleaning', 'commercial cleaning', 'clean'
+    ],
+    'is_waste': ['waste management', 'waste removal', 'refuse', 'garbage collection'],
+    'mentions_hygiene': ['hygiene'],
+    'mentions_cleaning': ['cleaning'],
+})
+
+def read_body(response, limit):
+    """Read at most limit bytes of a streamed response body, then close it."""
+    body = bytearray()
+    for chunk in response.iter_content(chunk_size=65536):
+        body += chunk
+        if len(body) >= limit:
+            break
+    response.close()
+    return bytes(body[:limit])
+
 def test_url(url, timeout=8):
     """Test if a URL works and return status."""
     try:
-        response = requests.get(url, headers=HEADERS, timeout=timeout, verify=False, allow_redirects=True)
+        response = SESSION.get(url, timeout=timeout, verify=False, stream=True)
         if response.status_code == 200:
-            return True, response.url, response.text[:10000]
+            body = read_body(response, 10000)
+            return True, response.url, body.decode(response.encoding or 'utf-8', errors='replace')
         else:
+            response.close()
             return False, None, None
     except:
         return False, None, None
 
 def extract_emails(text):
     """Extract emails from text."""
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    emails = list(set(re.findall(email_pattern, text)))
+    emails = list(set(EMAIL_RE.findall(text)))
 
     # Filter decision maker emails
-    generic_patterns = ['info@', 'hello@', 'contact@', 'support@', 'admin@', 'enquiries@', 'reception@']
-    decision_maker = [e for e in emails if not any(p in e.lower() for p in generic_patterns)]
-    generic = [e for e in emails if any(p in e.lower() for p in generic_patterns)]
+    decision_maker = []
+    generic = []
+    for e in emails:
+        (generic if GENERIC_EMAIL_RE.search(e.lower()) else decision_maker).append(e)
 
     return decision_maker[:3] if decision_maker else generic[:2]
 
+def fetch_page_text(url):
+    """Fetch one page and return its visible text (first 3000 chars), or ''."""
+    host = urlparse(url).netloc
+    if host in DEAD_HOSTS:
+        return ""
+
+    # stream=True returns once headers arrive, so a ConnectionError here
+    # (including ConnectTimeout) means the host is unreachable; errors while
+    # reading a slow body further down don't count
+    try:
+        response = SESSION.get(url, timeout=8, verify=False, stream=True)
+    except requests.exceptions.ConnectionError:
+        # Skip the rest of this host's sub-pages
+        DEAD_HOSTS.add(host)
+        return ""
+    except:
+        return ""
+
+    try:
+        if response.status_code != 200:
+            response.close()
+            return ""
+
+        soup = BeautifulSoup(read_body(response, MAX_BODY_BYTES), 'lxml', parse_only=BODY_ONLY)
+        for elem in soup.find_all(DECOMPOSE_TAGS):
+            elem.decompose()
+        return soup.get_text(separator=' ', strip=True)[:3000]
+    except:
+        response.close()
+        return ""
+
 def scrape_company_details(url):
     """Get company details from website."""
     pages_to_try = ['/', '/about', '/services', '/contact']
-    all_text = ""
-
-    for page in pages_to_try:
-        try:
-            response = requests.get(urljoin(url, page), headers=HEADERS, timeout=8, verify=False)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                for elem in soup(['script', 'style', 'nav', 'footer']):
-                    elem.decompose()
-                all_text += " " + soup.get_text(separator=' ', strip=True)[:3000]
-            time.sleep(0.5)
-        except:
-            continue
+
+    # Homepage first, so an unreachable host is known before fanning out;
+    # the other sub-pages are independent and fetched side by side
+    homepage = fetch_page_text(urljoin(url, pages_to_try[0]))
+    with ThreadPoolExecutor(max_workers=PAGE_WORKERS) as executor:
+        page_texts = [homepage, *executor.map(fetch_page_text, [urljoin(url, page) for page in pages_to_try[1:]])]
+    all_text = "".join(" " + text for text in page_texts if text)
 
     if all_text:
         emails = extract_emails(all_text)
@@ -64,31 +171,14 @@ def scrape_company_details(url):
         # Determine focus
         text_lower = all_text.lower()
 
-        if any(kw in text_lower for kw in ['office cleaning', 'corporate cleaning', 'workplace']):
-            focus = "Office cleaning specialist"
-        elif any(kw in text_lower for kw in ['industrial', 'factory', 'warehouse']):
-            focus = "Industrial cleaning services"
-        elif any(kw in text_lower for kw in ['restaurant', 'food', 'kitchen']):
-            focus = "Restaurant cleaning services"
-        elif any(kw in text_lower for kw in ['medical', 'healthcare', 'hospital', 'clinic']):
-            focus = "Medical facility cleaning"
-        elif any(kw in text_lower for kw in ['carpet', 'floor', 'upholstery']):
-            focus = "Carpet and floor cleaning"
-        elif any(kw in text_lower for kw in ['window', 'glass', 'facade']):
-            focus = "Window cleaning specialist"
-        elif any(kw in text_lower for kw in ['retail', 'shop', 'store']):
-            focus = "Retail space cleaning"
-        else:
-            focus = "Commercial cleaning services"
+        found = PAGE_MATCHER.match(text_lower)
+        focus = next((label for label in FOCUS_LABELS if label in found), "Commercial cleaning services")
 
         # Check if actually a cleaning company
-        is_cleaning = any(kw in text_lower for kw in [
-            'cleaning service', 'cleaning company', 'cleaner', 'janitorial',
-            'office cleaning', 'commercial cleaning', 'clean'
-        ])
+        is_cleaning = 'is_cleaning' in found
 
-        is_waste = any(kw in text_lower for kw in ['waste management', 'waste removal', 'refuse', 'garbage collection'])
-        is_hygiene_only = 'hygiene' in text_lower and 'cleaning' not in text_lower
+        is_waste = 'is_waste' in found
+        is_hygiene_only = 'mentions_hygiene' in found and 'mentions_cleaning' not in found
 
         return {
             'emails': emails,
@@ -179,6 +269,52 @@ SA_CLEANING_COMPANIES = [
     }
 ]
 
+def verify_company(company):
+    """
+    Test and scrape one company.
+
+    Returns:
+        tuple: (log lines, verified lead dict or None)
+    """
+    log = [f"Testing: {company['name']}"]
+
+    # Try main URL
+    works, final_url, content = test_url(company['url'])
+
+    # Try backup URL if main fails
+    if not works and company['backup_url']:
+        log.append(f"  Main URL failed, trying backup...")
+        works, final_url, content = test_url(company['backup_url'])
+
+    lead = None
+    if works:
+        log.append(f"  ✅ Website works: {final_url}")
+
+        # Scrape details
+        details = scrape_company_details(final_url)
+
+        if details and details['is_cleaning']:
+            lead = {
+                'name': company['name'],
+                'website': final_url,
+                'emails': details['emails'],
+                'focus': details['focus'],
+                'employee_count': '20-100+'
+            }
+            log.append(f"  ✅ VERIFIED as cleaning company")
+            log.append(f"     Focus: {details['focus']}")
+            log.append(f"     Emails: {len(details['emails'])}")
+        elif details and details['is_waste']:
+            log.append(f"  ❌ REJECTED: Waste management, not cleaning")
+        elif details and details['is_hygiene_only']:
+            log.append(f"  ❌ REJECTED: Hygiene services, not cleaning")
+        else:
+            log.append(f"  ⚠️  Could not verify as cleaning company")
+    else:
+        log.append(f"  ❌ Website doesn't work")
+
+    return log, lead
+
 def verify_all_companies():
     """Verify all companies and collect working ones."""
     print("=" * 70)
@@ -188,48 +324,21 @@ def verify_all_companies():
 
     verified_leads = []
 
-    for company in SA_CLEANING_COMPANIES:
-        if len(verified_leads) >= 10:
-            break
-
-        print(f"Testing: {company['name']}")
-
-        # Try main URL
-        works, final_url, content = test_url(company['url'])
-
-        # Try backup URL if main fails
-        if not works and company['backup_url']:
-            print(f"  Main URL failed, trying backup...")
-            works, final_url, content = test_url(company['backup_url'])
-
-        if works:
-            print(f"  ✅ Website works: {final_url}")
-
-            # Scrape details
-            details = scrape_company_details(final_url)
-
-            if details and details['is_cleaning']:
-                verified_leads.append({
-                    'name': company['name'],
-                    'website': final_url,
-                    'emails': details['emails'],
-                    'focus': details['focus'],
-                    'employee_count': '20-100+'
-                })
-                print(f"  ✅ VERIFIED as cleaning company")
-                print(f"     Focus: {details['focus']}")
-                print(f"     Emails: {len(details['emails'])}")
-            elif details and details['is_waste']:
-                print(f"  ❌ REJECTED: Waste management, not cleaning")
-            elif details and details['is_hygiene_only']:
-                print(f"  ❌ REJECTED: Hygiene services, not cleaning")
-            else:
-                print(f"  ⚠️  Could not verify as cleaning company")
-        else:
-            print(f"  ❌ Website doesn't work")
-
-        print()
-        time.sleep(1)
+    # Companies are checked concurrently; results are reported in list order
+    # and the first 10 verified ones are kept
+    with ThreadPoolExecutor(max_workers=COMPANY_WORKERS) as executor:
+        futures = [executor.submit(verify_company, company) for company in SA_CLEANING_COMPANIES]
+
+        for future in futures:
+            if len(verified_leads) >= 10:
+                future.cancel()
+                continue
+
+            log, lead = future.result()
+            print("\n".join(log))
+            print()
+            if lead:
+                verified_leads.append(lead)
 
     return verified_leads
 
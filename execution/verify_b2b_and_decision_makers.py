@@ -3,10 +3,15 @@
 Verify each company is B2B cleaning focused and try to find decision-maker emails.
 """
 
+import atexit
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import re
-import time
+from concurrent.futures import ThreadPoolExecutor
+from keyword_helper import KeywordMatcher
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlparse
+from urllib3.util.retry import Retry
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -14,6 +19,66 @@ HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
 }
 
+# One pooled session: the sub-pages of a company share a host, so keep-alive
+# saves a TCP + TLS handshake on every request after the first
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+_adapter = HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=20,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504], raise_on_status=False)
+)
+SESSION.mount('http://', _adapter)
+SESSION.mount('https://', _adapter)
+atexit.register(SESSION.close)
+
+# Companies checked at once, and sub-pages fetched at once per company
+COMPANY_WORKERS = 10
+PAGE_WORKERS = 4
+
+# Only the <body> is parsed; these tags are dropped before reading text
+BODY_ONLY = SoupStrainer('body')
+DECOMPOSE_TAGS = frozenset({'script', 'style', 'nav', 'footer'})
+
+# Hosts that refused or timed out while connecting; their remaining
+# sub-pages are skipped (a slow page alone doesn't mark a host dead)
+DEAD_HOSTS = set()
+
+def _keyword_re(keywords):
+    """Compile keywords into one alternation (matches if any is a substring)."""
+    return re.compile('|'.join(map(re.escape, keywords)))
+
+EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+
+# Page-text signals, found in one pass over the lowercased text
+PAGE_MATCHER = KeywordMatcher({
+    'is_b2b': [
+        'commercial cleaning', 'office cleaning', 'business cleaning',
+        'corporate cleaning', 'workplace cleaning', 'facility cleaning',
+        'industrial cleaning', 'retail cleaning', 'restaurant cleaning',
+        'medical facility', 'healthcare cleaning', 'school cleaning',
+        'b2b', 'business to business', 'commercial clients', 'corporate clients'
+    ],
+    'is_residential': [
+        'home cleaning', 'residential cleaning', 'house cleaning',
+        'domestic cleaning', 'maid service'
+    ],
+    'is_waste': [
+        'waste management', 'waste removal', 'refuse collection',
+        'garbage collection', 'trash removal', 'skip hire'
+    ],
+})
+
+# Email categories (matched against the lowercased address)
+DECISION_MAKER_EMAIL_RE = _keyword_re([
+    'ceo@', 'director@', 'owner@', 'founder@', 'managing@',
+    'md@', 'gm@', 'manager@', 'operations@', 'sales@'
+])
+GENERIC_EMAIL_RE = _keyword_re([
+    'info@', 'contact@', 'hello@', 'support@', 'admin@',
+    'enquiries@', 'reception@', 'office@'
+])
+
 COMPANIES = [
     {'name': 'Bidvest Prestige Cleaning', 'website': 'https://www.bidvestprestige.co.za'},
     {'name': 'ServiceMaster SA', 'website': 'https://www.servicemaster.co.za'},
@@ -27,76 +92,75 @@ COMPANIES = [
     {'name': 'A-Len Cleaning Services', 'website': 'https://www.alen.co.za'}
 ]
 
+def fetch_page(full_url):
+    """
+    Fetch one page.
+
+    Returns:
+        tuple: (lowercased visible text or None, emails found in the raw HTML)
+    """
+    host = urlparse(full_url).netloc
+    if host in DEAD_HOSTS:
+        return None, []
+
+    # stream=True returns once headers arrive, so a ConnectionError here
+    # (including ConnectTimeout) means the host is unreachable; errors while
+    # reading a slow body further down don't count
+    try:
+        response = SESSION.get(full_url, timeout=10, verify=False, stream=True)
+    except requests.exceptions.ConnectionError:
+        # Skip the rest of this host's sub-pages
+        DEAD_HOSTS.add(host)
+        return None, []
+    except:
+        return None, []
+
+    try:
+        if response.status_code == 200:
+            soup = BeautifulSoup(response.content, 'lxml', parse_only=BODY_ONLY)
+            
+            # Remove scripts, styles
+            for elem in soup.find_all(DECOMPOSE_TAGS):
+                elem.decompose()
+            
+            text = soup.get_text(separator=' ', strip=True)
+            
+            # Extract emails
+            emails = EMAIL_RE.findall(response.text)
+            return text.lower(), emails
+    except:
+        pass
+    finally:
+        response.close()
+    return None, []
+
 def deep_scrape_company(url):
     """Scrape company website for B2B indicators and decision-maker info."""
     try:
         pages = ['/', '/about', '/about-us', '/services', '/contact', '/team', '/leadership']
-        all_text = ""
-        all_emails = []
-        
-        for page in pages:
-            try:
-                full_url = url.rstrip('/') + page
-                response = requests.get(full_url, headers=HEADERS, timeout=10, verify=False, allow_redirects=True)
-                
-                if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, 'html.parser')
-                    
-                    # Remove scripts, styles
-                    for elem in soup(['script', 'style', 'nav', 'footer']):
-                        elem.decompose()
-                    
-                    text = soup.get_text(separator=' ', strip=True)
-                    all_text += " " + text.lower()
-                    
-                    # Extract emails
-                    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-                    emails = re.findall(email_pattern, response.text)
-                    all_emails.extend(emails)
-                
-                time.sleep(0.5)
-            except:
-                continue
+
+        # Homepage first, so an unreachable host is known before fanning out;
+        # the other sub-pages are independent and fetched side by side
+        base = url.rstrip('/')
+        homepage = fetch_page(base + pages[0])
+        with ThreadPoolExecutor(max_workers=PAGE_WORKERS) as executor:
+            page_results = [homepage, *executor.map(fetch_page, [base + page for page in pages[1:]])]
+
+        all_text = "".join(" " + text for text, _ in page_results if text is not None)
+        all_emails = [email for _, emails in page_results for email in emails]
         
         # Check if B2B cleaning
-        b2b_keywords = [
-            'commercial cleaning', 'office cleaning', 'business cleaning',
-            'corporate cleaning', 'workplace cleaning', 'facility cleaning',
-            'industrial cleaning', 'retail cleaning', 'restaurant cleaning',
-            'medical facility', 'healthcare cleaning', 'school cleaning',
-            'b2b', 'business to business', 'commercial clients', 'corporate clients'
-        ]
-        
-        residential_keywords = [
-            'home cleaning', 'residential cleaning', 'house cleaning',
-            'domestic cleaning', 'maid service'
-        ]
-        
-        waste_keywords = [
-            'waste management', 'waste removal', 'refuse collection',
-            'garbage collection', 'trash removal', 'skip hire'
-        ]
-        
-        is_b2b = any(kw in all_text for kw in b2b_keywords)
-        is_residential = any(kw in all_text for kw in residential_keywords)
-        is_waste = any(kw in all_text for kw in waste_keywords)
+        found = PAGE_MATCHER.match(all_text)
+        is_b2b = 'is_b2b' in found
+        is_residential = 'is_residential' in found
+        is_waste = 'is_waste' in found
         
         # Find decision-maker emails
         all_emails = list(set(all_emails))
         
         # Categorize emails
-        decision_maker_patterns = [
-            'ceo@', 'director@', 'owner@', 'founder@', 'managing@',
-            'md@', 'gm@', 'manager@', 'operations@', 'sales@'
-        ]
-        
-        generic_patterns = [
-            'info@', 'contact@', 'hello@', 'support@', 'admin@',
-            'enquiries@', 'reception@', 'office@'
-        ]
-        
-        decision_maker_emails = [e for e in all_emails if any(p in e.lower() for p in decision_maker_patterns)]
-        generic_emails = [e for e in all_emails if any(p in e.lower() for p in generic_patterns)]
+        decision_maker_emails = [e for e in all_emails if DECISION_MAKER_EMAIL_RE.search(e.lower())]
+        generic_emails = [e for e in all_emails if GENERIC_EMAIL_RE.search(e.lower())]
         other_emails = [e for e in all_emails if e not in decision_maker_emails and e not in generic_emails]
         
         return {
@@ -120,12 +184,14 @@ if __name__ == "__main__":
     
     results = []
     
-    for idx, company in enumerate(COMPANIES, 1):
+    # Scrape all companies concurrently; map yields results in list order
+    executor = ThreadPoolExecutor(max_workers=COMPANY_WORKERS)
+    scraped = executor.map(deep_scrape_company, [company['website'] for company in COMPANIES])
+    
+    for idx, (company, result) in enumerate(zip(COMPANIES, scraped), 1):
         print(f"{idx}. {company['name']}")
         print(f"   Website: {company['website']}")
         
-        result = deep_scrape_company(company['website'])
-        
         if 'error' in result:
             print(f"   ⚠️  Could not scrape: {result['error']}")
             results.append({
@@ -169,7 +235,8 @@ if __name__ == "__main__":
             })
         
         print()
-        time.sleep(1)
+    
+    executor.shutdown()
     
     # Summary
     print("=" * 80)
@@ -0,0 +1,68 @@
+"""
+yt-dlp helper functions.
+Locates the yt-dlp executable once per process for the transcription scripts,
+and exposes the in-process yt_dlp API when the package is importable.
+"""
+
+import os
+import re
+import shutil
+from functools import lru_cache
+
+# Library API avoids spawning a second Python interpreter per call; scripts
+# fall back to the yt-dlp executable when the module isn't importable
+try:
+    from yt_dlp import YoutubeDL
+except ImportError:
+    YoutubeDL = None
+
+# Post id in Instagram URLs: /p/<id>/, /reel/<id>/ or /tv/<id>/
+VIDEO_ID_RE = re.compile(r'/(?:p|reel|tv)/([^/?#]+)')
+
+# Checked in order when yt-dlp is not on PATH
+YT_DLP_CANDIDATES = [
+    '/Users/jaydenmortimer/Library/Python/3.9/bin/yt-dlp',
+    os.path.expanduser('~/Library/Python/3.9/bin/yt-dlp'),
+    '/usr/local/bin/yt-dlp',
+]
+
+
+@lru_cache(maxsize=1)
+def yt_dlp_path():
+    """
+    Find the yt-dlp executable (PATH first, then common install locations).
+
+    Returns:
+        str: Path to yt-dlp
+
+    Raises:
+        FileNotFoundError: If yt-dlp is not installed
+    """
+    path = shutil.which('yt-dlp')
+    if path:
+        return path
+
+    # os.access does one syscall and also rejects non-executable matches
+    for path in YT_DLP_CANDIDATES:
+        if os.access(path, os.X_OK):
+            return path
+
+    raise FileNotFoundError("yt-dlp not found. Please install with: pip3 install yt-dlp")
+
+
+def extract_video_id(url):
+    """
+    Extract a clean identifier from an Instagram URL for file naming.
+
+    Args:
+        url (str): Instagram URL, e.g. https://www.instagram.com/p/DTO6HfSjTnE/
+
+    Returns:
+        str: Post id, or the last path segment for other URLs
+    """
+    match = VIDEO_ID_RE.search(url)
+    if match:
+        return match.group(1)
+
+    # Fallback: use last part of URL
+    return url.rstrip('/').rsplit('/', 1)[-1] or 'instagram_video'